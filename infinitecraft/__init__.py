@@ -10,19 +10,41 @@ Join our Discord server -> https://discord.gg/EPr4T2F8bq
 Play Infinite Craft by Neal Agarwal on your browser -> https://neal.fun/infinite-craft/
 """
 
-__title__ = "infinite-craft"
-__full_title__ = "Infinite Craft"
-__description__ = "An API Wrapper for Neal's Infinite Craft game in Python."
-__cli_description__ = "Infinite Craft Utilities"
-__author__ = "SqdNoises"
-__license__ = "MIT License"
-__copyright__ = "Copyright (C) 2024-present SqdNoises, Neal Agarwal"
-__github__ = "https://github.com/sqdnoises/infinite-craft"
-__discord__ = "https://discord.gg/EPr4T2F8bq"
-__version__ = "1.1.4"
-__display_version__ = __title__ + " " + __version__
+from typing import TYPE_CHECKING, Any
+
+from ._meta import (
+    __title__,
+    __full_title__,
+    __description__,
+    __cli_description__,
+    __author__,
+    __license__,
+    __copyright__,
+    __github__,
+    __discord__,
+    __version__,
+    __display_version__
+)
 
 from .element       import *
-from .infinitecraft import *
 from .logger        import *
-from .errors        import *
\ No newline at end of file
+from .errors        import *
+from .              import element, logger, errors
+
+if TYPE_CHECKING:
+    from .infinitecraft import InfiniteCraft
+
+__all__ = (
+    *element.__all__,
+    "InfiniteCraft",
+    *logger.__all__,
+    *errors.__all__
+)
+
+def __getattr__(name: str) -> Any:
+    # InfiniteCraft pulls in the HTTP client (aiohttp), so it is only imported when first used,
+    # which keeps the CLI and anything only needing the metadata or Element fast to import
+    if name == "InfiniteCraft":
+        from .infinitecraft import InfiniteCraft
+        return InfiniteCraft
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,20 +11,17 @@ Play Infinite Craft by Neal Agarwal on your browser -> https://neal.fun/infinite
 """
 
 import os
-import uvicorn
 import argparse
 
-from .      import (
+from ._meta import (
     __title__,
     __license__,
     __copyright__,
     __cli_description__,
     __display_version__,
     __github__,
-    __discord__,
-    InfiniteCraft
+    __discord__
 )
-from .utils import mock_server
 
 # implement in future
 # if os.name == "nt":
@@ -39,7 +36,7 @@ from .utils import mock_server
 # else:
 #     import readline
 
-def main(args: argparse.Namespace) -> None:
+def main(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
     if args.version:
         print(__display_version__)
     elif args.information:
@@ -55,17 +52,27 @@ def main(args: argparse.Namespace) -> None:
     else:
         parser.print_usage()
 
-def reset_subcommand(args: argparse.Namespace) -> None:
-    discoveries_storage = os.path.expandvars(os.path.expanduser(args.discoveries))
+def _resolve(path: str) -> str:
+    return os.path.expandvars(os.path.expanduser(path))
+
+def reset_subcommand(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    discoveries_storage = _resolve(args.discoveries)
     
-    if not os.path.exists(discoveries_storage):
+    from . import InfiniteCraft # only loaded here, it pulls in the HTTP client
+    try:
+        InfiniteCraft.reset(discoveries_storage=discoveries_storage) # checks that the file exists
+    except FileNotFoundError:
         parser.error(f"File '{discoveries_storage}' not found")
-        
-    InfiniteCraft.reset(discoveries_storage=discoveries_storage)
+    except OSError as error: # e.g. no permission to write it
+        parser.error(f"Couldn't reset '{discoveries_storage}': {error.strerror or error}")
 
     print(f'"{discoveries_storage}" file contents reset successfully.')
 
-def mock_subcommand(args: argparse.Namespace) -> None:
+def mock_subcommand(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    # only the mock server needs these, and they are slow to import
+    import uvicorn
+    from .utils import mock_server
+    
     app = mock_server()
     uvicorn.run(
         app,
@@ -73,76 +80,83 @@ def mock_subcommand(args: argparse.Namespace) -> None:
         port = args.port
     )
 
-parser = argparse.ArgumentParser(
-    prog = __title__,
-    description = f"{__display_version__}\n"
-                  f"{__copyright__}\n"
-                  f"License: {__license__}\n"
-                  f"For more information, see: {__github__}#license\n"
-                   "\n"
-                  f"Need help?\n"
-                  f"Join our coummunity server! {__discord__}",
-    allow_abbrev = False,
-    formatter_class = argparse.RawDescriptionHelpFormatter
-)
-
-parser.add_argument(
-    "-V", "--version",
-    action = "store_true",
-    help = "display the version and exit"
-)
-
-parser.add_argument(
-    "-I", "--information",
-    action = "store_true",
-    help = "display program information and exit"
-)
-
-parser.set_defaults(func=main)
-subparser = parser.add_subparsers(help="subcommands")
-
-reset = subparser.add_parser(
-    "reset",
-    prog = "reset",
-    description = "reset discoveries file",
-    allow_abbrev = False
-)
-
-reset.add_argument(
-    "-d", "--discoveries",
-    action = "store",
-    type = str,
-    help = "Path to discoveries.json file (default: discoveries.json)",
-    default = "discoveries.json"
-)
-
-reset.set_defaults(func=reset_subcommand)
-
-mock = subparser.add_parser(
-    "mock",
-    prog = "mock",
-    description = "mock server for testing purposes",
-    allow_abbrev = False
-)
-
-mock.add_argument(
-    "-H", "--host",
-    action = "store",
-    type = str,
-    help = "Hostname to host at",
-    default = "127.0.0.1"
-)
-
-mock.add_argument(
-    "-p", "-P", "--port",
-    action = "store",
-    type = int,
-    help = "Port to host at",
-    default = 15575
-)
-
-mock.set_defaults(func=mock_subcommand)
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog = __title__,
+        description = f"{__display_version__}\n"
+                      f"{__copyright__}\n"
+                      f"License: {__license__}\n"
+                      f"For more information, see: {__github__}#license\n"
+                       "\n"
+                      f"Need help?\n"
+                      f"Join our coummunity server! {__discord__}",
+        allow_abbrev = False,
+        formatter_class = argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument(
+        "-V", "--version",
+        action = "store_true",
+        help = "display the version and exit"
+    )
+    
+    parser.add_argument(
+        "-I", "--information",
+        action = "store_true",
+        help = "display program information and exit"
+    )
+    
+    parser.set_defaults(func=main)
+    subparser = parser.add_subparsers(help="subcommands")
+    
+    reset = subparser.add_parser(
+        "reset",
+        prog = "reset",
+        description = "reset discoveries file",
+        allow_abbrev = False
+    )
+    
+    reset.add_argument(
+        "-d", "--discoveries",
+        action = "store",
+        type = str,
+        help = "Path to discoveries.json file (default: discoveries.json)",
+        default = "discoveries.json"
+    )
+    
+    reset.set_defaults(func=reset_subcommand)
+    
+    mock = subparser.add_parser(
+        "mock",
+        prog = "mock",
+        description = "mock server for testing purposes",
+        allow_abbrev = False
+    )
+    
+    mock.add_argument(
+        "-H", "--host",
+        action = "store",
+        type = str,
+        help = "Hostname to host at",
+        default = "127.0.0.1"
+    )
+    
+    mock.add_argument(
+        "-p", "-P", "--port",
+        action = "store",
+        type = int,
+        help = "Port to host at",
+        default = 15575
+    )
+    
+    mock.set_defaults(func=mock_subcommand)
+    
+    return parser
 
 def parse() -> None:
+    parser = _build_parser()
     args = parser.parse_args()
-    args.func(args)
\ No newline at end of file
+    args.func(parser, args)
+
+if __name__ == "__main__":
+    parse()
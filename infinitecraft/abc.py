@@ -26,6 +26,8 @@ class ElementProtocol(Protocol):
         is_first_discovery (bool | None): Indicates if the element was the first discovery.
     """
     
+    __slots__ = () # lets slotted implementations (like Element) drop the per-instance __dict__
+    
     name: str | None
     emoji: str | None
     is_first_discovery: bool | None
@@ -10,11 +10,23 @@ from ..abc   import (
     AsyncAPIClientResponseProtocol
 )
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 __all__ = (
     "AiohttpClient",
     "AiohttpClientResponse"
 )
 
+# connector settings used unless a `connector` is passed in;
+# every request goes to the same host, so keep a pool of warm connections to it
+CONNECTOR_LIMIT = 64
+CONNECTOR_LIMIT_PER_HOST = 32
+CONNECTOR_KEEPALIVE_TIMEOUT = 75 # seconds an idle connection is kept for reuse
+CONNECTOR_TTL_DNS_CACHE = 300 # seconds
+
 # TODO: Add docstrings
 class AiohttpClient(AsyncAPIClientProtocol):
     _base_url: str
@@ -59,10 +71,22 @@ class AiohttpClient(AsyncAPIClientProtocol):
     async def start(self) -> None:
         """Start the session."""
         if self._session is None:
+            session_kwargs = self._session_kwargs
+            if "connector" not in session_kwargs:
+                session_kwargs = {
+                    "connector": aiohttp.TCPConnector(
+                        limit = CONNECTOR_LIMIT,
+                        limit_per_host = CONNECTOR_LIMIT_PER_HOST,
+                        keepalive_timeout = CONNECTOR_KEEPALIVE_TIMEOUT,
+                        ttl_dns_cache = CONNECTOR_TTL_DNS_CACHE
+                    ),
+                    **session_kwargs
+                }
+            
             self._session = aiohttp.ClientSession(
                 self._base_url,
                 headers = self._headers,
-                **self._session_kwargs
+                **session_kwargs
             )
     
     async def get(
@@ -122,11 +146,16 @@ class AiohttpClientResponse(AsyncAPIClientResponseProtocol):
     async def json(
         self,
         *,
-        loads: Callable[[str], Any] = json.loads,
+        loads: Callable[[str], Any] | None = None,
         **kwargs: Any
     ) -> Any:
-        content = await self.text()
-        return loads(content, **kwargs)
+        if loads is None:
+            # orjson takes no options, so kwargs meant for json.loads need the stdlib
+            if orjson is not None and not kwargs:
+                # parse the raw body directly, skipping charset detection and decoding
+                return orjson.loads(await self._response.read())
+            loads = json.loads
+        return loads(await self.text(), **kwargs)
     
     def raise_for_status(self) -> None:
         if not self.ok:
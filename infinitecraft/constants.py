@@ -1,10 +1,43 @@
+import json
+from types  import MappingProxyType
+from typing import Any
 from .types import Discovery
 
 __all__ = (
+    "pair_route",
+    "ping_params",
+    "default_headers",
     "starting_discoveries",
+    "starting_discoveries_json",
 )
 
-starting_discoveries: list[Discovery] = [
+# API route that pairs two elements, and the (fixed) query ping() sends to it
+pair_route = "/api/infinite-craft/pair"
+ping_params: MappingProxyType[str, str] = MappingProxyType({
+    "first":  "Fire",
+    "second": "Water"
+})
+
+# headers sent with every API request, built once and copied into each instance;
+# read-only, as it is shared by every instance
+default_headers: MappingProxyType[str, str] = MappingProxyType({
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "priority": "u=1, i",
+    "cache-control": "no-cache",
+    "pragma": "no-cache",
+    "sec-ch-ua": '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "Referer": "https://neal.fun/infinite-craft/",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
+})
+
+_starting_discoveries: list[Discovery] = [
     {
         "name": "Water",
         "emoji": "💧",
@@ -25,4 +58,12 @@ starting_discoveries: list[Discovery] = [
         "emoji": "🌍",
         "is_first_discovery": False,
     }
-]
\ No newline at end of file
+]
+
+# read-only, so it can be shared without defensive copies (use dict(d) for a mutable copy)
+starting_discoveries: tuple[MappingProxyType[str, Any], ...] = tuple(
+    MappingProxyType(discovery) for discovery in _starting_discoveries # pyright: ignore[reportArgumentType]
+)
+
+# starting_discoveries already serialized (UTF-8, 2-space indent) so resets can write it as-is
+starting_discoveries_json: bytes = json.dumps(_starting_discoveries, indent=2, ensure_ascii=False).encode("utf-8")
@@ -5,7 +5,7 @@ __all__ = (
     "Element",
 )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False) # __eq__ and __hash__ are defined below
 class Element(ElementProtocol):
     """
     Represents an element in the Infinite Craft system.
@@ -24,6 +24,7 @@ class Element(ElementProtocol):
         __str__: Returns a string combining the emoji and name of the element.
         __repr__: Returns a string representation of how the object was created.
         __eq__: Compares the element name with another element's name.
+        __hash__: Hashes the element by its name, consistent with `__eq__`.
         __bool__: Returns False if all attributes are None, otherwise True.
 
     Example:
@@ -43,6 +44,8 @@ class Element(ElementProtocol):
         The `emoji` attribute is not fetched upon creation of the class. 
         If the emoji is not provided, it must be fetched manually, such as by reading 
         a discoveries JSON file or other data source.
+
+        Elements use `__slots__`, so they have no `__dict__` and can't be weakly referenced.
     """
     
     name: str | None = None
@@ -64,9 +67,9 @@ class Element(ElementProtocol):
             'Water'
         """
         if self.emoji:
-            return str(self.emoji) + " " + str(self.name)
+            return f"{self.emoji} {self.name}"
         else:
-            return str(self.name)
+            return f"{self.name}"
     
     def __repr__(self) -> str:
         """
@@ -79,13 +82,7 @@ class Element(ElementProtocol):
             >>> repr(Element(name="Fire", emoji="🔥"))
             "Element(name='Fire', emoji='🔥', is_first_discovery=None)"
         """
-        return (
-            f"Element("
-            f"name={repr(self.name)}, "
-            f"emoji={repr(self.emoji)}, "
-            f"is_first_discovery={repr(self.is_first_discovery)}"
-            f")"
-        )
+        return f"Element(name={self.name!r}, emoji={self.emoji!r}, is_first_discovery={self.is_first_discovery!r})"
     
     def __eq__(self, other: ElementProtocol | None) -> bool:
         """
@@ -106,12 +103,28 @@ class Element(ElementProtocol):
             >>> fire1 == Element(name="Water")
             False
         """
-        if not self and other is None:
-            return True
-        elif isinstance(other, ElementProtocol) and other.name == self.name:
-            return True
-        else:
+        if other is None:
+            return not self
+        # same-class comparisons skip the (slow) runtime protocol check
+        if type(other) is not type(self) and not isinstance(other, ElementProtocol):
             return False
+        name = self.name
+        other_name = other.name
+        return other_name is name or other_name == name
+    
+    def __hash__(self) -> int:
+        """
+        Returns a hash of the element based on the name, so that elements which compare
+        equal also hash equal and can be used in sets and as dictionary keys.
+
+        Returns:
+            int: The hash of the element's name.
+        
+        Example:
+            >>> {Element(name="Fire", emoji="🔥"), Element(name="Fire")}
+            {Element(name='Fire', emoji='🔥', is_first_discovery=None)}
+        """
+        return hash(self.name)
     
     def __bool__(self) -> bool:
         """
@@ -11,13 +11,19 @@ Play Infinite Craft by Neal Agarwal on your browser -> https://neal.fun/infinite
 """
 
 import os
-import copy
+import sys
 import json
+import atexit
+import codecs
 import time
 import asyncio
+import weakref
+import itertools
+import threading
 from typing import (
     Any, Callable,
-    MutableMapping
+    Iterable, AsyncIterable,
+    AsyncIterator, MutableMapping
 )
 
 from .          import utils
@@ -29,7 +35,13 @@ from .abc       import (
     ElementProtocol,
     AsyncAPIClientProtocol
 )
-from .constants import starting_discoveries
+from .constants import (
+    pair_route,
+    ping_params,
+    default_headers,
+    starting_discoveries,
+    starting_discoveries_json
+)
 from .types     import (
     ResultDict,
     Discovery
@@ -39,6 +51,19 @@ __all__ = (
     "InfiniteCraft",
 )
 
+# instances with discoveries that may still need saving, held weakly so an instance that is
+# never closed can still be garbage collected (along with all of its discoveries)
+_instances: "weakref.WeakSet[InfiniteCraft]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_instances() -> None:
+    """Save unsaved discoveries of every live instance when the program exits."""
+    for game in list(_instances):
+        try:
+            game.flush()
+        except Exception as error:
+            game._logger.error(f"Couldn't save discoveries to '{game.discoveries_location}': {error!r}") # pyright: ignore[reportPrivateUsage]
+
 class InfiniteCraft:
     """
     An API Wrapper for Neal's Infinite Craft game in Python.
@@ -111,6 +136,7 @@ class InfiniteCraft:
     
     _api_url: str
     _api_rate_limit : int
+    _api_rate_limit_window: float = 60 # seconds a request counts towards the rate limit
     _manual_control: bool
     _discoveries_location: str
     _encoding: str
@@ -119,8 +145,15 @@ class InfiniteCraft:
     _requests: list[float]
     _session_cls: type[AsyncAPIClientProtocol]
     _requests: list[float]
+    _raw_discoveries: list[Discovery]
+    _discovery_names: set[str | None]
+    _saved_discoveries: int
+    _pair_cache: dict[tuple[str | None, str | None], ElementProtocol]
+    _save_lock: threading.Lock
+    _save_task: "asyncio.Task[None] | None"
+    _discoveries_save_every: int = 25 # new discoveries to collect before saving them to the file
     _discoveries: list[ElementProtocol]
-    discoveries: list[ElementProtocol]
+    _discoveries_by_name: dict[str | None, ElementProtocol]
     _session: AsyncAPIClientProtocol | None
     _headers: MutableMapping[str, str]
     
@@ -148,12 +181,10 @@ class InfiniteCraft:
             if not make_file:
                 raise FileNotFoundError(f"File '{discoveries_storage}' not found")
             
+            # check_file() has already made sure the file can be created,
+            # so write the starting discoveries without going through reset()
             logger.warn(f"Resetting discoveries storage JSON file ({discoveries_storage})")
-            self.reset(
-                discoveries_storage=discoveries_storage,
-                encoding=encoding,
-                make_file=make_file
-            )
+            self._write_starting_discoveries(discoveries_storage, encoding=encoding)
             dsreset = True
         
         self._api_url = api_url
@@ -171,34 +202,27 @@ class InfiniteCraft:
         self._requests = []
         
         if do_reset and not dsreset:
+            # the file is known to exist here, no need for reset() to check again
             self._logger.warn(f"Resetting discoveries JSON file ({discoveries_storage})")
-            self.reset(
-                discoveries_storage=discoveries_storage,
-                encoding=encoding
-            )
-
+            self._write_starting_discoveries(discoveries_storage, encoding=encoding)
+
+        self._raw_discoveries = []
+        self._discovery_names = set()
+        self._saved_discoveries = 0
+        self._save_lock = threading.Lock()
+        self._save_task = None
+        self._pair_cache = {}
         self._discoveries = []
-        self.discoveries = copy.deepcopy(self._discoveries)
-        self.get_discoveries(set_value=True)
+        self._discoveries_by_name = {}
+        if dsreset or do_reset:
+            # the file has just been written with the starting discoveries, no need to read it back
+            self._build_discoveries([dict(discovery) for discovery in starting_discoveries], set_value=True) # type: ignore
+        else:
+            self.get_discoveries(set_value=True) # loads the discoveries file into memory once
+        _instances.add(self) # don't lose unsaved discoveries if the program exits without close()
 
         self._session = None
-        self._headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "priority": "u=1, i",
-            "cache-control": "no-cache",
-            "pragma": "no-cache",
-            "sec-ch-ua": '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "Referer": "https://neal.fun/infinite-craft/",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
-        }
-        self._headers.update(headers)
+        self._headers = {**default_headers, **headers}
 
         self._logger.debug("InfiniteCraft has been initialised.")
         self._logger.debug("Need help? Join the community server -> https://discord.gg/EPr4T2F8bq")
@@ -303,6 +327,45 @@ class InfiniteCraft:
         """
         return self._session.closed if self._session is not None else None
     
+    @property
+    def discoveries(self) -> list[ElementProtocol]:
+        """
+        The discovered elements.
+
+        This is the list the instance keeps up to date itself, not a copy, so it should
+        not be modified. Use `get_discoveries()` to get a list of your own.
+
+        Returns:
+            list[ElementProtocol]: A list of all discovered elements.
+        """
+        return self._discoveries
+    
+    @property
+    def _debug_enabled(self) -> bool:
+        """
+        Whether the logger would emit debug messages.
+
+        Loggers that do not expose `debug_enabled` are assumed to always emit them.
+
+        Note:
+            This property is intended for internal use only.
+        """
+        return getattr(self._logger, "debug_enabled", True)
+    
+    @property
+    def _unsaved_discoveries(self) -> int:
+        """
+        How many discoveries have been added since the discoveries file was last written.
+
+        The raw discoveries are only ever appended to, so this is worked out from how many
+        of them the last successful write saved, rather than kept as a counter that a failed
+        write could reset or a write in a worker thread could race with.
+
+        Note:
+            This property is intended for internal use only.
+        """
+        return len(self._raw_discoveries) - self._saved_discoveries
+    
     def __str__(self) -> str:
         """
         Returns a string representation of the InfiniteCraft instance.
@@ -310,8 +373,12 @@ class InfiniteCraft:
         Returns:
             str: A string containing the number of discoveries and the closed status of the session.
         """
-        discoveries = len(self._discoveries)
-        return f"<InfiniteCraft discoveries={discoveries} closed={self.closed}>"
+        discoveries = getattr(self, "_discoveries", None) # missing if __init__ failed
+        session = getattr(self, "_session", None)
+        return (
+            f"<InfiniteCraft discoveries={len(discoveries) if discoveries is not None else None} "
+            f"closed={session.closed if session is not None else None}>"
+        )
 
     def __repr__(self) -> str:
         """
@@ -361,11 +428,33 @@ class InfiniteCraft:
         Note:
             This method is intended for internal use only.
         """
-        self._session = self._session_cls(
+        session = self._session_cls(
             base_url = self.api_url,
             headers = self._headers
         )
-        await self._session.start()
+        await session.start()
+        # only keep the session once it has started, so a failed start can be retried
+        self._session = session
+
+    def _require_session(self) -> AsyncAPIClientProtocol:
+        """
+        Get the API client session, making sure it can be used.
+
+        Returns:
+            AsyncAPIClientProtocol: The running API client session.
+
+        Raises:
+            RuntimeError: If the session has not been started yet or is closed.
+
+        Note:
+            This method is intended for internal use only.
+        """
+        session = self._session
+        if session is None:
+            raise RuntimeError("Session has not been started yet")
+        elif session.closed:
+            raise RuntimeError("Session is closed")
+        return session
 
     async def start(self) -> None:
         """
@@ -390,7 +479,8 @@ class InfiniteCraft:
         Close the InfiniteCraft session.
 
         This method closes the current session if it's active. It ensures that all
-        resources associated with the session are properly released.
+        resources associated with the session are properly released and that any
+        discoveries not saved yet are written to the discoveries file.
 
         Raises:
             RuntimeError: If the session has not been started or is already closed.
@@ -400,8 +490,15 @@ class InfiniteCraft:
         elif self._session and self._session.closed:
             raise RuntimeError("Session is already closed")
         else:
-            await self._session.close()
-            self._logger.debug("Closed session")
+            try:
+                if self._save_task is not None:
+                    await asyncio.wait((self._save_task,)) # a failed save has been logged, and is retried below
+                if self._unsaved_discoveries:
+                    await asyncio.to_thread(self._write_discoveries)
+            finally:
+                # the session is closed even if saving failed, the exit hook will try saving again
+                await self._session.close()
+                self._logger.debug("Closed session")
 
     async def stop(self) -> None:
         """
@@ -429,25 +526,22 @@ class InfiniteCraft:
             float: The latency in seconds.
 
         Raises:
-            RuntimeError: If the session has not been started yet.
+            RuntimeError: If the session has not been started yet or is closed.
         """
-        if self._session is None:
-            raise RuntimeError("Session has not been started yet")
-        
-        self._logger.debug(f"Pinging API route: {self.api_url}/api/infinite-craft/pair with Fire + Water")
+        session = self._require_session()
         
-        params = {
-            "first":  "Fire",
-            "second": "Water"
-        }
+        debug = self._debug_enabled
+        if debug:
+            self._logger.debug(f"Pinging API route: {self.api_url}{pair_route} with Fire + Water")
         
         request = await self._wait_for_request() # wait for ratelimit requests to finish
         
         start = time.monotonic()
-        async with await self._session.get(f"/api/infinite-craft/pair", params=params) as response:
+        async with await session.get(pair_route, params=ping_params) as response:
             self._done_with_request(request) # mark request as done
             end = time.monotonic() - start
-            self._logger.debug(f"API response time: {end}s")
+            if debug:
+                self._logger.debug(f"API response time: {end}s")
             response.raise_for_status()
         
         return end
@@ -460,6 +554,10 @@ class InfiniteCraft:
         the result. If the combination is not possible, it returns an Element with
         all attributes set to None.
 
+        Pairing is deterministic and does not depend on the order of the elements, so
+        results are remembered for the lifetime of the instance and pairing the same two
+        elements again returns the remembered result without contacting the API.
+
         Args:
             first (ElementProtocol): The first element to pair.
             second (ElementProtocol): The second element to pair.
@@ -470,12 +568,74 @@ class InfiniteCraft:
                               with all attributes as None if they couldn't be paired.
 
         Raises:
-            RuntimeError: If the session has not been started yet.
+            RuntimeError: If the session has not been started yet or is closed.
         """
-        if self._session is None:
-            raise RuntimeError("Session has not been started yet")
+        self._require_session()
         
-        self._logger.debug(f"Pairing {first} and {second}...")
+        debug = self._debug_enabled
+        if debug:
+            self._logger.debug(f"Pairing {first} and {second}...")
+        
+        first_name, second_name = first.name, second.name
+        if (first_name or "") > (second_name or ""):
+            key = (second_name, first_name)
+        else:
+            key = (first_name, second_name)
+        
+        result = self._pair_cache.get(key)
+        if result is None:
+            result = await self._request_pair(first, second, debug=debug)
+            self._pair_cache[key] = result
+        elif debug:
+            self._logger.debug(f"Using remembered result of {first} + {second}")
+        
+        if result.name is None: # couldn't be paired
+            return result
+
+        if debug:
+            if not result.is_first_discovery:
+                self._logger.debug(f"Result: {result} (first: {first} + second: {second})")
+            else:
+                self._logger.debug(f"Result: {result} (First Discovery) (first: {first} + second: {second})")
+
+        if store:
+            updated = self._update_discoveries(
+                name = result.name,
+                emoji = result.emoji,
+                is_first_discovery = result.is_first_discovery
+            )
+            
+            if updated is not None: # new discovery, the in-memory list only needs the one element
+                self._discoveries.append(result)
+                self._discoveries_by_name[result.name] = result
+                
+                if self._unsaved_discoveries >= self._discoveries_save_every and (self._save_task is None or self._save_task.done()):
+                    # write in a worker thread so the event loop (and other pairs) keep running
+                    self._save_task = asyncio.create_task(asyncio.to_thread(self._write_discoveries))
+                    self._save_task.add_done_callback(self._log_save_error)
+
+        return result
+    
+    async def _request_pair(self, first: ElementProtocol, second: ElementProtocol, *, debug: bool) -> ElementProtocol:
+        """
+        Request the result of pairing two elements from the API.
+
+        Args:
+            first (ElementProtocol): The first element to pair.
+            second (ElementProtocol): The second element to pair.
+            debug (bool): Whether debug messages should be logged.
+
+        Returns:
+            ElementProtocol: The resulting element, or an ElementProtocol with all
+                              attributes as None if they couldn't be paired.
+
+        Raises:
+            RuntimeError: If the session has not been started yet or is closed.
+
+        Note:
+            This method is intended for internal use only.
+        """
+        session = self._require_session()
         
         params = {
             "first":  first.name,
@@ -484,59 +644,34 @@ class InfiniteCraft:
         
         request = await self._wait_for_request() # wait for ratelimit requests to finish
         
-        async with await self._session.get(f"/api/infinite-craft/pair", params=params) as response:
+        async with await session.get(pair_route, params=params) as response:
             self._done_with_request(request) # mark request as done
             # Request & Response Info
-            self._logger.debug(f"{response.request_method} {response.request_url}\n"
-                               f"Request Headers: {json.dumps(dict(response.request_headers), indent=4)}\n"
-                               f"Response Status: {response.status}\n"
-                               f"Response Content Type: {response.content_type}\n"
-                               f"Response Headers: {json.dumps(dict(response.headers), indent=4)}\n"
-                               f"Response Body: {await response.text()}")
+            if debug:
+                self._logger.debug(f"{response.request_method} {response.request_url}\n"
+                                   f"Request Headers: {json.dumps(dict(response.request_headers), indent=4)}\n"
+                                   f"Response Status: {response.status}\n"
+                                   f"Response Content Type: {response.content_type}\n"
+                                   f"Response Headers: {json.dumps(dict(response.headers), indent=4)}\n"
+                                   f"Response Body: {await response.text()}")
             
             response.raise_for_status()
             result_data: ResultDict = await response.json()
         
-        if result_data == {
-            "result": "Nothing",
-            "emoji": "",
-            "isNew": False
-        }:
-            self._logger.debug(f"Unable to mix {first} + {second}")
+        name, emoji, is_new = result_data["result"], result_data["emoji"], result_data["isNew"]
+        
+        # the API answers {"result": "Nothing", "emoji": "", "isNew": false} for pairs that don't mix
+        if name == "Nothing" and emoji == "" and not is_new:
+            if debug:
+                self._logger.debug(f"Unable to mix {first} + {second}")
             return self._element_cls(name=None, emoji=None, is_first_discovery=None)
         
-        result = self._element_cls(
-            name               = result_data.get("result"),
-            emoji              = result_data.get("emoji"),
-            is_first_discovery = result_data.get("isNew")
+        return self._element_cls(
+            name               = sys.intern(name),
+            emoji              = emoji,
+            is_first_discovery = is_new
         )
 
-        if not result.is_first_discovery:
-            self._logger.debug(f"Result: {result} (first: {first} + second: {second})")
-        else:
-            self._logger.debug(f"Result: {result} (First Discovery) (first: {first} + second: {second})")
-
-        if store:
-            self._update_discoveries(
-                name = result.name,
-                emoji = result.emoji,
-                is_first_discovery = result.is_first_discovery
-            )
-            
-            raw_discoveries: list[Discovery] = self._get_raw_discoveries()
-            discoveries: list[ElementProtocol] = [
-                self._element_cls(
-                    name = rd.get("name"),
-                    emoji = rd.get("emoji"),
-                    is_first_discovery = rd.get("is_first_discovery")
-                ) for rd in raw_discoveries
-            ]
-            
-            self._discoveries = discoveries
-            self.discoveries = self._discoveries.copy()
-
-        return result
-
     async def merge(self, first: ElementProtocol, second: ElementProtocol, *, store: bool = True) -> ElementProtocol | None:
         """
         Pair two elements and return the resulting element.
@@ -557,7 +692,7 @@ class InfiniteCraft:
                               with all attributes as None if they couldn't be paired.
 
         Raises:
-            RuntimeError: If the session has not been started yet.
+            RuntimeError: If the session has not been started yet or is closed.
         """
         return await self.pair(first=first, second=second, store=store)
     
@@ -581,10 +716,152 @@ class InfiniteCraft:
                               with all attributes as None if they couldn't be paired.
 
         Raises:
-            RuntimeError: If the session has not been started yet.
+            RuntimeError: If the session has not been started yet or is closed.
         """
         return await self.pair(first=first, second=second, store=store)
 
+    async def pair_many(
+        self,
+        pairs: Iterable[tuple[ElementProtocol, ElementProtocol]],
+        *,
+        concurrency: int = 10,
+        store: bool = True
+    ) -> list[ElementProtocol]:
+        """
+        Pair many elements concurrently and return the resulting elements.
+
+        This method runs `concurrency` workers with `asyncio.gather` that take pairs
+        from `pairs` one at a time, so at most `concurrency` requests are in flight and
+        only that many coroutines exist no matter how many pairs are given. The API rate
+        limit is still respected for every request. If a pair fails, the other workers are
+        cancelled before the error is raised.
+
+        Args:
+            pairs (Iterable[tuple[ElementProtocol, ElementProtocol]]): The pairs of elements to pair.
+            concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 10.
+            store (bool, optional): Whether to store the results in discoveries. Defaults to True.
+
+        Returns:
+            list[ElementProtocol]: The resulting elements, in the same order as `pairs`.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            RuntimeError: If the session has not been started yet or is closed.
+        """
+        if not concurrency >= 1:
+            raise ValueError("concurrency must be greater than or equal to 1")
+
+        self._require_session()
+
+        pairs = list(pairs)
+        results: list[ElementProtocol] = [None] * len(pairs) # type: ignore
+        queue = iter(enumerate(pairs)) # shared by the workers, safe as they all run on this event loop
+
+        async def worker() -> None:
+            for index, (first, second) in queue:
+                # storing a result doesn't await between checking and adding a discovery,
+                # so workers can't interleave there and no lock is needed
+                results[index] = await self.pair(first, second, store=store)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(pairs)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # a pair failed (or we were cancelled), don't leave the other workers sending requests
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return results
+
+    async def pair_stream(
+        self,
+        pairs: Iterable[tuple[ElementProtocol, ElementProtocol]] | AsyncIterable[tuple[ElementProtocol, ElementProtocol]],
+        *,
+        concurrency: int = 10,
+        store: bool = True
+    ) -> AsyncIterator[tuple[tuple[ElementProtocol, ElementProtocol], ElementProtocol]]:
+        """
+        Pair many elements concurrently and yield the results as they arrive.
+
+        Unlike `pair_many`, pairs are taken from `pairs` lazily, so it can be a generator
+        (or an async generator) that decides what to pair next based on earlier results,
+        and every result is yielded as soon as its request finishes instead of after the
+        whole batch. At most `concurrency` requests are in flight at once and the API rate
+        limit is still respected for every request.
+
+        The workers are only cancelled when the generator is closed, so if you may stop
+        iterating early (e.g. with `break`), wrap it in `contextlib.aclosing()` so they
+        stop right away instead of whenever the generator is garbage collected:
+
+        >>> async with contextlib.aclosing(game.pair_stream(pairs)) as stream:
+        ...     async for (first, second), result in stream:
+        ...         if result.is_first_discovery:
+        ...             break
+
+        Args:
+            pairs (Iterable[tuple[ElementProtocol, ElementProtocol]] | AsyncIterable[tuple[ElementProtocol, ElementProtocol]]):
+                The pairs of elements to pair.
+            concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 10.
+            store (bool, optional): Whether to store the results in discoveries. Defaults to True.
+
+        Yields:
+            tuple[tuple[ElementProtocol, ElementProtocol], ElementProtocol]: Each pair together
+                                                                            with its resulting element,
+                                                                            in completion order.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            RuntimeError: If the session has not been started yet or is closed.
+        """
+        if not concurrency >= 1:
+            raise ValueError("concurrency must be greater than or equal to 1")
+
+        self._require_session()
+
+        if isinstance(pairs, AsyncIterable):
+            async_source = aiter(pairs)
+            source_lock = asyncio.Lock() # an async iterator can't be advanced by two workers at once
+
+            async def next_pair() -> tuple[ElementProtocol, ElementProtocol] | None:
+                async with source_lock:
+                    return await anext(async_source, None)
+        else:
+            source = iter(pairs)
+
+            async def next_pair() -> tuple[ElementProtocol, ElementProtocol] | None:
+                return next(source, None)
+
+        # each worker puts its results, then None (or the exception it failed with) when it stops
+        results: asyncio.Queue[tuple[tuple[ElementProtocol, ElementProtocol], ElementProtocol] | Exception | None] = asyncio.Queue()
+
+        async def worker() -> None:
+            try:
+                while (elements := await next_pair()) is not None:
+                    first, second = elements
+                    results.put_nowait((elements, await self.pair(first, second, store=store)))
+            except Exception as error:
+                results.put_nowait(error)
+            else:
+                results.put_nowait(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                item = await results.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # the caller stopped early or a pair failed, don't leave requests running
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     def get_discoveries(self, *, set_value: bool = False, check: Callable[[ElementProtocol], bool] | None = None) -> list[ElementProtocol]:
         """
         Get a list containing all discovered elements.
@@ -595,31 +872,79 @@ class InfiniteCraft:
 
         Args:
             set_value (bool, optional): Whether to update the instance's discoveries
-                                        attribute with the retrieved data. Defaults to False.
+                                        attribute (and the in-memory copy new discoveries
+                                        are added to) with the retrieved data. Defaults to False.
             check (Callable[[ElementProtocol], bool] | None, optional): A function to filter
                                                                         the discoveries. Defaults to None.
 
         Returns:
             list[ElementProtocol]: A list of all discovered elements, potentially filtered.
+
+        Note:
+            New discoveries that have not been saved to the file yet are included too, and
+            they are still saved later.
         """
-        raw_discoveries = self._get_raw_discoveries()
-        discoveries: list[ElementProtocol] = []
-        for discovery in raw_discoveries:
-            element = self._element_cls(
-                name = discovery.get("name"),
+        raw_discoveries = self._load_raw_discoveries()
+        saved = len(raw_discoveries)
+        
+        if self._unsaved_discoveries:
+            # the file doesn't have these yet, so add them instead of losing them
+            names = {discovery.get("name") for discovery in raw_discoveries}
+            raw_discoveries.extend(
+                discovery for discovery in self._unsaved_raw_discoveries()
+                if discovery.get("name") not in names
+            )
+        
+        discoveries = self._build_discoveries(raw_discoveries, set_value=set_value, check=check)
+        if set_value:
+            self._saved_discoveries = saved # the ones added above still have to be written
+        return discoveries
+    
+    def _build_discoveries(
+        self,
+        raw_discoveries: list[Discovery],
+        *,
+        set_value: bool = False,
+        check: Callable[[ElementProtocol], bool] | None = None
+    ) -> list[ElementProtocol]:
+        """
+        Build the discovered elements from raw discoveries.
+
+        Args:
+            raw_discoveries (list[Discovery]): The raw discoveries, as stored in the discoveries file.
+            set_value (bool, optional): Whether to make these the instance's discoveries. Defaults to False.
+            check (Callable[[ElementProtocol], bool] | None, optional): A function to filter
+                                                                        the discoveries. Defaults to None.
+
+        Returns:
+            list[ElementProtocol]: A list of all discovered elements, potentially filtered.
+
+        Note:
+            This method is intended for internal use only.
+        """
+        element_cls = self._element_cls
+        # names are interned so that the same name coming back from the API later
+        # shares one string object, and element comparisons hit the identity check
+        elements: list[ElementProtocol] = [
+            element_cls(
+                name = sys.intern(name) if (name := discovery.get("name")) is not None else None,
                 emoji = discovery.get("emoji"),
                 is_first_discovery = discovery.get("is_first_discovery")
-            )
+            ) for discovery in raw_discoveries
+        ]
 
-            if check is not None:
-                if check(element):
-                    discoveries.append(element)
-            else:
-                discoveries.append(element)
+        if check is not None:
+            discoveries = [element for element in elements if check(element)]
+        else:
+            discoveries = elements
 
         if set_value:
+            self._raw_discoveries = raw_discoveries
+            self._saved_discoveries = len(raw_discoveries) # they are what the file holds
+            self._discovery_names = {element.name for element in elements}
             self._discoveries = discoveries
-            self.discoveries = self._discoveries.copy()
+            # reversed, so the first of any duplicate names in the file wins like it would in a scan
+            self._discoveries_by_name = {element.name: element for element in reversed(discoveries)}
         
         return discoveries
     
@@ -638,14 +963,22 @@ class InfiniteCraft:
         Returns:
             ElementProtocol | None: The discovered Element if found, None otherwise.
 
+        Note:
+            With `from_file`, new discoveries that have not been saved to the file yet are
+            found too.
         """
-        dummy = self._element_cls(name=name, emoji=None, is_first_discovery=None)
-
         if from_file:
-            discovery = self.get_discoveries(check=lambda e: e.name == dummy)
-            return discovery[0] if discovery else None
+            # compare the raw names and only build an Element for the match
+            for discovery in itertools.chain(self._load_raw_discoveries(), self._unsaved_raw_discoveries()):
+                if discovery.get("name") == name:
+                    return self._element_cls(
+                        name = name,
+                        emoji = discovery.get("emoji"),
+                        is_first_discovery = discovery.get("is_first_discovery")
+                    )
+            return None
 
-        return self._discoveries[self._discoveries.index(dummy)] if dummy in self._discoveries else None
+        return self._discoveries_by_name.get(name)
     
     async def _wait_for_request(self) -> float:
         """
@@ -665,9 +998,9 @@ class InfiniteCraft:
         current = time.monotonic()
         self._requests.append(current)
         
-        while len(self._requests) > self.api_rate_limit and self._requests[0] + 60 > time.monotonic():
-            self._logger.warn(f"We are getting ratelimited! Retrying in {(self._requests[0] + 60) - time.monotonic()}s...")
-            await asyncio.sleep((self._requests[0] + 60) - time.monotonic())
+        while len(self._requests) > self.api_rate_limit and self._requests[0] + self._api_rate_limit_window > time.monotonic():
+            self._logger.warn(f"We are getting ratelimited! Retrying in {(self._requests[0] + self._api_rate_limit_window) - time.monotonic()}s...")
+            await asyncio.sleep((self._requests[0] + self._api_rate_limit_window) - time.monotonic())
         
         return current
     
@@ -688,10 +1021,12 @@ class InfiniteCraft:
 
     def _update_discoveries(self, *, name: str | None, emoji: str | None, is_first_discovery: bool | None) -> list[Discovery] | None:
         """
-        Update the discoveries JSON file with a new element.
+        Add a new element to the discoveries.
 
-        This internal method adds a new element to the discoveries file if it doesn't
-        already exist. It's typically called after a successful pairing operation.
+        This internal method adds a new element to the in-memory raw discoveries if it
+        doesn't already exist. It's typically called after a successful pairing operation.
+        The discoveries file is not written here; new discoveries are saved in batches by
+        `pair()`, and when the session is closed, the program exits or `flush()` is called.
 
         Args:
             name (str | None): Name of the new element.
@@ -711,23 +1046,79 @@ class InfiniteCraft:
             "is_first_discovery": is_first_discovery
         }
 
-        discoveries = self._get_raw_discoveries()
-        if element["name"] in [e["name"] for e in discoveries]:
+        if name in self._discovery_names:
             return None
         
+        discoveries = self._raw_discoveries
         discoveries.append(element)
-
-        with open(self.discoveries_location, "w", encoding=self.encoding) as f:
-            json.dump(discoveries, f, indent=2)
+        self._discovery_names.add(name)
         
         return discoveries
+    
+    def flush(self) -> None:
+        """
+        Write new discoveries that have not been saved yet to the discoveries JSON file.
+
+        New discoveries are saved in batches while pairing, when the session is closed
+        and when the program exits, so this only needs to be called to make sure the file
+        is up to date at a specific point (e.g. before another program reads it).
+        """
+        if self._unsaved_discoveries:
+            self._write_discoveries()
+    
+    def _write_discoveries(self) -> None:
+        """
+        Write the in-memory discoveries to the discoveries JSON file.
+
+        This can run in a worker thread. Writes are serialized by a lock and always write
+        the latest in-memory state, so a slower earlier write can never overwrite a newer one.
+
+        Note:
+            This method is intended for internal use only.
+        """
+        with self._save_lock:
+            raw_discoveries = self._raw_discoveries
+            discoveries = raw_discoveries.copy() # the event loop may append while this is encoded
+            utils.dump_json(self.discoveries_location, discoveries, encoding=self.encoding, indent=2) # kept readable
+            
+            # only count them as saved once the write has succeeded, and not if they were reloaded meanwhile
+            if self._raw_discoveries is raw_discoveries:
+                self._saved_discoveries = len(discoveries)
+    
+    def _log_save_error(self, task: "asyncio.Task[None]") -> None:
+        """
+        Log the error a background save of the discoveries failed with, if any.
+
+        The discoveries stay unsaved, so they are written again by the next save.
+
+        Args:
+            task (asyncio.Task[None]): The finished background save.
+
+        Note:
+            This method is intended for internal use only.
+        """
+        if not task.cancelled() and (error := task.exception()) is not None:
+            self._logger.error(f"Couldn't save discoveries to '{self.discoveries_location}': {error!r}")
 
-    def _get_raw_discoveries(self) -> list[Discovery]:
+    def _unsaved_raw_discoveries(self) -> list[Discovery]:
         """
-        Retrieve the raw list of discoveries from the JSON file.
+        Get the raw discoveries that have been added since the discoveries file was last written.
+
+        Returns:
+            list[Discovery]: The unsaved discoveries as dictionaries, oldest first.
+
+        Note:
+            This method is intended for internal use only.
+        """
+        return self._raw_discoveries[self._saved_discoveries:]
+    
+    def _load_raw_discoveries(self) -> list[Discovery]:
+        """
+        Read the raw list of discoveries from the JSON file.
 
         This internal method reads the discoveries JSON file and returns its contents
-        as a list of Discovery dictionaries.
+        as a list of Discovery dictionaries. It never writes, so discoveries that have
+        not been saved yet are not included.
 
         Returns:
             list[Discovery]: A list of all discovered elements as dictionaries.
@@ -735,8 +1126,7 @@ class InfiniteCraft:
         Note:
             This method is intended for internal use only.
         """
-        with open(self.discoveries_location, encoding=self.encoding) as f:
-            return json.load(f)
+        return utils.load_json(self.discoveries_location, encoding=self.encoding)
     
     @staticmethod
     def reset(
@@ -764,10 +1154,31 @@ class InfiniteCraft:
         Raises:
             FileNotFoundError: If the file doesn't exist and make_file is False.
         """
-        if not os.path.exists(discoveries_storage):
-            if make_file:
-                utils.check_file(discoveries_storage)
-            else:
-                raise FileNotFoundError(f"File '{discoveries_storage}' not found")
+        if make_file:
+            utils.check_file(discoveries_storage)
+        elif not os.path.exists(discoveries_storage):
+            raise FileNotFoundError(f"File '{discoveries_storage}' not found")
         
-        utils.dump_json(discoveries_storage, starting_discoveries, encoding=encoding, indent=indent)
\ No newline at end of file
+        InfiniteCraft._write_starting_discoveries(discoveries_storage, encoding=encoding, indent=indent)
+    
+    @staticmethod
+    def _write_starting_discoveries(discoveries_storage: str, *, encoding: str = "utf-8", indent: int = 2) -> None:
+        """
+        Write the starting discoveries to the discoveries storage file.
+
+        For the default UTF-8 encoding and 2-space indentation, the pre-serialized
+        `starting_discoveries_json` is written as-is instead of encoding the data again.
+
+        Args:
+            discoveries_storage (str): Path to the discoveries storage file.
+            encoding (str, optional): Encoding to use for the file. Defaults to "utf-8".
+            indent (int, optional): Number of spaces for indentation in the JSON file.
+                                    Defaults to 2.
+
+        Note:
+            This method is intended for internal use only.
+        """
+        if indent == 2 and codecs.lookup(encoding).name == "utf-8":
+            utils.write_file_atomic(discoveries_storage, starting_discoveries_json)
+        else:
+            utils.dump_json(discoveries_storage, [dict(d) for d in starting_discoveries], encoding=encoding, indent=indent)
\ No newline at end of file
@@ -32,11 +32,16 @@ Copyright (c) 2023-present SqdNoises
 """
 
 import os
+import sys
+import time
+import queue
+import atexit
+import threading
 import traceback
 from datetime import datetime
 from typing import (
     Any, Literal,
-    Callable
+    Callable, TextIO
 )
 
 from .termcolors import *
@@ -48,6 +53,16 @@ __all__ = (
 
 LOGGER_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_FILE_NAME_TIME_FORMAT = "%Y-%m-%d %H-%M-%S"
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+LOG_FILE_WRITER_BATCH_SIZE = 256
+LOG_FILE_WRITER_EXIT_TIMEOUT = 5
+LOG_LEVELS = {
+    "info": 1,
+    "warning": 2,
+    "error": 3,
+    "critical": 4,
+    "debug": 5
+}
 LOG_TYPES_TEXT = {
     "text": {
         "info": "INFO    ",
@@ -65,6 +80,39 @@ LOG_TYPES_TEXT = {
     }
 }
 
+_timestamp_cache = threading.local()
+
+def _cached_timestamp(time_format: str) -> str:
+    """
+    Formats the current local time, re-formatting at most once per second per thread.
+    
+    Parameters:
+    - time_format (str): A `strftime` format without sub-second directives.
+    
+    Returns:
+    - str: The formatted timestamp.
+    """
+    second = int(time.time())
+    if getattr(_timestamp_cache, "second", None) != second or _timestamp_cache.time_format != time_format:
+        _timestamp_cache.timestamp = datetime.fromtimestamp(second).strftime(time_format)
+        _timestamp_cache.second = second
+        _timestamp_cache.time_format = time_format
+    return _timestamp_cache.timestamp
+
+class _DirectLogQueue:
+    """
+    Takes the place of a logger's queue once its writer thread has stopped at exit,
+    writing each record straight away on the calling thread.
+    """
+    
+    __slots__ = ("_logger",)
+    
+    def __init__(self, logger: "Logger") -> None:
+        self._logger = logger
+    
+    def put(self, record: tuple[str, str] | None) -> None:
+        if record is not None:
+            self._logger._write_log_records([record]) # pyright: ignore[reportPrivateUsage]
 
 class Logger:
     """
@@ -93,6 +141,28 @@ class Logger:
     ```
     """
     
+    __slots__ = (
+        "_name",
+        "logs_folder",
+        "log_file_name_time_format",
+        "_log_file",
+        "_log_file_handle",
+        "_log_queue",
+        "_log_writer",
+        "_log_writer_lock",
+        "_prefix",
+        "_log_level",
+        "_log_file_log_level",
+        "_max_level",
+        "_name_color",
+        "_timestamp_color",
+        "_message_color",
+        "_time_format",
+        "_cache_timestamp",
+        "_log_types_text",
+        "_prefix_templates"
+    )
+    
     def __init__(
         self,
         name: str = "INFINITE CRAFT",
@@ -111,23 +181,150 @@ class Logger:
         """
         Initialize the Logger instance with the specified configuration options.
         """
-        self.name = str(name)
+        self._name = str(name)
         self.logs_folder = logs_folder
-        self.log_file = self._get_log_file_path(logs_folder, log_file_name_time_format) if logs_folder else None
-        self.prefix = prefix or self._prefix_handler
-        self.log_level = log_level
-        self.log_file_log_level = log_file_log_level
-        self.name_color = name_color
-        self.timestamp_color = timestamp_color
-        self.message_color = message_color
+        self._log_file = self._get_log_file_path(logs_folder, log_file_name_time_format) if logs_folder else None
+        self._log_file_handle: TextIO | None = None # only touched by the writer thread, or by callers once it has stopped
+        self._log_queue: queue.SimpleQueue[tuple[str, str] | None] | _DirectLogQueue | None = None
+        self._log_writer: threading.Thread | None = None
+        self._log_writer_lock = threading.Lock()
+        self._prefix = prefix
+        self._log_level = log_level
+        self._log_file_log_level = log_file_log_level
+        self._update_max_level()
+        self._name_color = name_color
+        self._timestamp_color = timestamp_color
+        self._message_color = message_color
         self.time_format = time_format
         self.log_file_name_time_format = log_file_name_time_format
-        self.log_types_text = log_types_text
+        self._log_types_text = log_types_text
+        self._build_prefix_templates()
+    
+    @property
+    def prefix(self) -> Callable[..., str]:
+        """Prefix function for log messages."""
+        return self._prefix or self._prefix_handler
+    
+    @prefix.setter
+    def prefix(self, value: Callable[..., str] | None) -> None:
+        self._prefix = value
+    
+    @property
+    def log_file(self) -> str | None:
+        """Path to the log file, or None if logs are not saved."""
+        return self._log_file
+    
+    @log_file.setter
+    def log_file(self, value: str | None) -> None:
+        self._log_file = value
+        self._update_max_level()
+    
+    @property
+    def log_level(self) -> int:
+        """Minimum log level for printing to the console."""
+        return self._log_level
+    
+    @log_level.setter
+    def log_level(self, value: int) -> None:
+        self._log_level = value
+        self._update_max_level()
+    
+    @property
+    def log_file_log_level(self) -> int:
+        """Minimum log level for saving to a log file."""
+        return self._log_file_log_level
+    
+    @log_file_log_level.setter
+    def log_file_log_level(self, value: int) -> None:
+        self._log_file_log_level = value
+        self._update_max_level()
+    
+    @property
+    def name(self) -> str:
+        """Name of the logger."""
+        return self._name
+    
+    @name.setter
+    def name(self, value: Any) -> None:
+        self._name = str(value)
+        self._build_prefix_templates()
+    
+    @property
+    def name_color(self) -> str:
+        """Color for the logger name in log messages."""
+        return self._name_color
+    
+    @name_color.setter
+    def name_color(self, value: str) -> None:
+        self._name_color = value
+        self._build_prefix_templates()
+    
+    @property
+    def timestamp_color(self) -> str:
+        """Color for the timestamp in log messages."""
+        return self._timestamp_color
+    
+    @timestamp_color.setter
+    def timestamp_color(self, value: str) -> None:
+        self._timestamp_color = value
+        self._build_prefix_templates()
+    
+    @property
+    def message_color(self) -> str:
+        """Color for the message content."""
+        return self._message_color
+    
+    @message_color.setter
+    def message_color(self, value: str) -> None:
+        self._message_color = value
+        self._build_prefix_templates()
+    
+    @property
+    def time_format(self) -> str:
+        """Format for the log timestamps."""
+        return self._time_format
+    
+    @time_format.setter
+    def time_format(self, value: str) -> None:
+        self._time_format = value
+        # timestamps with sub-second precision can't be reused for a whole second
+        self._cache_timestamp = "%f" not in value
+    
+    @property
+    def log_types_text(self) -> dict[str, dict[str, str]]:
+        """Dictionary containing text and color formats for different log types."""
+        return self._log_types_text
     
+    @log_types_text.setter
+    def log_types_text(self, value: dict[str, dict[str, str]]) -> None:
+        self._log_types_text = value
+        self._build_prefix_templates()
+
+    @property
+    def debug_enabled(self) -> bool:
+        """
+        Whether debug-level messages are printed or saved at the current log levels.
+
+        Returns:
+        - bool: True if a debug message would be printed to the console or saved to the log file.
+        """
+        return self._max_level >= 5
+    
+    def _update_max_level(self) -> None:
+        """
+        Recomputes the highest log level that is printed or saved anywhere.
+        
+        Messages above this level are dropped before any formatting is done.
+        """
+        self._max_level = max(self._log_level, self._log_file_log_level if self._log_file else 0)
+
     def _get_log_file_path(self, logs_folder: str, log_file_name_time_format: str) -> str:
         """
         Generates a log file path with an incremented number if the file already exists.
         
+        The folder is listed once and free names are looked up in memory, instead of
+        checking each candidate path on disk.
+        
         Parameters:
         - logs_folder (str): Directory to save the log file.
         - log_file_name_time_format (str): Format for log file names.
@@ -137,13 +334,21 @@ class Logger:
         """
         base_name = f"{self.name} {datetime.now().strftime(log_file_name_time_format)}"
         log_file = os.path.join(logs_folder, f"{base_name}.log")
+        folder, file_name = os.path.split(log_file) # base_name could contain a separator
+        
+        try:
+            existing = set(os.listdir(folder or "."))
+        except (FileNotFoundError, NotADirectoryError):
+            existing = set()
+        
+        stem = file_name[:-len(".log")]
         counter = 1
         
-        while os.path.exists(log_file):
-            log_file = os.path.join(logs_folder, f"{base_name} {counter}.log")
+        while file_name in existing:
+            file_name = f"{stem} {counter}.log"
             counter += 1
         
-        return log_file
+        return os.path.join(folder, file_name)
     
     def log(
         self,
@@ -163,94 +368,262 @@ class Logger:
         - do_save (bool): Whether to save the log message to the log file (default: True).
         """
         log_level = self._get_log_level(log_type)
+        if log_level > self._max_level: # not printed or saved anywhere
+            return
+        self._log_at(log_level, log_type, message, do_print, do_save)
+    
+    def _log_at(
+        self,
+        log_level: int,
+        log_type: Literal["info", "warning", "error", "critical", "debug"] | int,
+        message: Any,
+        do_print: bool,
+        do_save: bool,
+        _str: type[str] = str,
+        _isinstance: Callable[..., bool] = isinstance
+    ) -> None:
+        """
+        Does the work of `log` for an already resolved log level.
+        
+        The level wrappers (`info`, `warning`, ...) call this directly with their constant level,
+        so the log type never has to be mapped to a level at runtime. `str` and `isinstance` are
+        bound as defaults and attributes are read once into locals, as this runs for every record.
+        """
+        text: str | None = None # str(message), computed once by whichever branch runs first
+        custom_prefix = self._prefix
         
         # Print log message if the level is less than or equal to current log level
-        if do_print and log_level <= self.log_level:
-            prefix = str(self.prefix(log_type))  # type: ignore
-            print(prefix + str(message), end=reset + "\n", flush=True)
+        if do_print and log_level <= self._log_level:
+            text = message if _isinstance(message, _str) else _str(message)
+            if custom_prefix is None:
+                prefix = self._prefix_handler(log_level)
+            else:
+                prefix = _str(custom_prefix(log_type))
+            stdout = sys.stdout
+            if stdout is not None: # e.g. pythonw has no console
+                stdout.write(prefix + text + reset + "\n")
+                # a terminal is line buffered so the write above already flushed, but
+                # piped or redirected output would otherwise sit in the buffer
+                if not getattr(stdout, "line_buffering", False):
+                    stdout.flush()
         
         # Save log message to file if applicable
-        if do_save and self.log_file and log_level <= self.log_file_log_level:
-            prefix = str(self.prefix(log_type, color=False))  # type: ignore
-            if self.logs_folder: os.makedirs(self.logs_folder, exist_ok=True)
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(prefix + str(message) + "\n")
+        log_file = self._log_file
+        if do_save and log_file and log_level <= self._log_file_log_level:
+            if text is None:
+                text = message if _isinstance(message, _str) else _str(message)
+            if custom_prefix is None:
+                prefix = self._prefix_handler(log_level, color=False)
+            else:
+                prefix = _str(custom_prefix(log_type, color=False))  # type: ignore
+            log_queue = self._log_queue
+            if log_queue is None:
+                log_queue = self._start_log_writer()
+            log_queue.put((log_file, prefix + text + "\n"))
     
-    def _get_log_level(self, log_type: Literal["info", "warning", "error", "critical", "debug"] | int) -> int:
-        """Helper method to map log types to log levels."""
-        log_level_mapping = {
-            "info": 1,
-            "warning": 2,
-            "error": 3,
-            "critical": 4,
-            "debug": 5
-        }
-        if isinstance(log_type, int):
-            return log_type
-        return log_level_mapping.get(log_type, 5)
+    def _start_log_writer(self) -> queue.SimpleQueue[tuple[str, str] | None] | _DirectLogQueue:
+        """
+        Starts the background thread that writes queued records to the log file.
+        
+        The thread is started on the first record saved to a file. At interpreter exit,
+        the queue is drained and the log file closed.
+        
+        Returns:
+        - queue.SimpleQueue: The queue records should be put on.
+        """
+        with self._log_writer_lock:
+            if self._log_queue is None:
+                log_queue: queue.SimpleQueue[tuple[str, str] | None] = queue.SimpleQueue()
+                self._log_writer = threading.Thread(
+                    target=self._log_writer_loop,
+                    args=(log_queue,),
+                    name=f"{self._name} log writer",
+                    daemon=True
+                )
+                self._log_writer.start()
+                atexit.register(self._stop_log_writer)
+                self._log_queue = log_queue
+            return self._log_queue
     
-    def info(self, message: str | Any, *, do_print: bool = True, do_save: bool = True) -> None:
+    def _stop_log_writer(self) -> None:
         """
-        Logs an info-level message.
-
+        Asks the writer thread to write out what is left in the queue and waits for it.
+        
+        Other exit hooks may still log after this one has run (hooks run in reverse order of
+        registration, and this one is registered on the first saved record), so once the thread
+        has stopped, records are written directly by the caller instead of being queued.
+        """
+        if isinstance(self._log_queue, queue.SimpleQueue) and self._log_writer is not None:
+            self._log_queue.put(None)
+            self._log_writer.join(LOG_FILE_WRITER_EXIT_TIMEOUT)
+            if not self._log_writer.is_alive():
+                self._log_queue = _DirectLogQueue(self)
+    
+    def _log_writer_loop(self, log_queue: queue.SimpleQueue[tuple[str, str] | None]) -> None:
+        """
+        Runs in the writer thread. Takes records off the queue in batches, writes each batch
+        with one call per log file and flushes once the queue has been drained.
+        
+        If the log file can't be written, saving to it is stopped (see `_stop_saving_log_file`)
+        and the thread exits.
+        
         Parameters:
-        - message (Any): Message content to log.
-        - do_print (bool): Whether to print the log message to the console (default: True).
-        - do_save (bool): Whether to save the log message to the log file (default: True).
+        - log_queue (queue.SimpleQueue): Queue of `(log file path, line)` records, `None` stops the loop.
         """
-        self.log("info", message, do_print=do_print, do_save=do_save)
+        running = True
+        while running:
+            batch = [log_queue.get()]
+            while len(batch) < LOG_FILE_WRITER_BATCH_SIZE:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            if None in batch:
+                running = False
+                batch = batch[:batch.index(None)]
+            
+            if not self._write_log_records(batch): # type: ignore
+                return
+        
+        log_file_handle, self._log_file_handle = self._log_file_handle, None
+        if log_file_handle is not None:
+            try:
+                log_file_handle.close()
+            except OSError as error:
+                self._stop_saving_log_file(error)
     
-    def warn(self, message: str | Any, *, do_print: bool = True, do_save: bool = True) -> None:
+    def _write_log_records(self, records: list[tuple[str, str]]) -> bool:
         """
-        Alias for warning(). Logs a warning-level message.
-
+        Writes records with one call per log file and flushes the open log file.
+        
+        A batch that fails for any other reason than the file being unwritable (e.g. a message
+        that can't be encoded) is reported on stderr and dropped, so later records are still saved.
+        
         Parameters:
-        - message (Any): Message content to log.
-        - do_print (bool): Whether to print the log message to the console (default: True).
-        - do_save (bool): Whether to save the log message to the log file (default: True).
+        - records (list[tuple[str, str]]): `(log file path, line)` records to write.
+        
+        Returns:
+        - bool: False if saving to the log file has been stopped, True otherwise.
         """
-        self.warning(message, do_print=do_print, do_save=do_save)
+        try:
+            lines: list[str] = []
+            log_file = None
+            for record in records:
+                if record[0] != log_file:
+                    if lines:
+                        self._write_log_lines(log_file, lines)  # type: ignore
+                        lines = []
+                    log_file = record[0]
+                lines.append(record[1])
+            if lines:
+                self._write_log_lines(log_file, lines)  # type: ignore
+            
+            if self._log_file_handle is not None:
+                self._log_file_handle.flush()
+        except OSError as error:
+            self._stop_saving_log_file(error)
+            return False
+        except Exception as error:
+            stderr = sys.stderr
+            if stderr is not None:
+                stderr.write(f"{self._name}: couldn't save {len(records)} log record(s) to '{self._log_file}': {error!r}\n")
+        return True
     
-    def warning(self, message: str | Any, *, do_print: bool = True, do_save: bool = True) -> None:
+    def _stop_saving_log_file(self, error: OSError) -> None:
         """
-        Logs a warning-level message.
-
+        Stops saving records to the log file after the writer thread failed to write it.
+        
+        The error is reported once on stderr, and `log_file` becomes None so no more records
+        are queued for a writer that is no longer running. Records are still printed.
+        
         Parameters:
-        - message (Any): Message content to log.
-        - do_print (bool): Whether to print the log message to the console (default: True).
-        - do_save (bool): Whether to save the log message to the log file (default: True).
+        - error (OSError): The error writing the log file failed with.
         """
-        self.log("warning", message, do_print=do_print, do_save=do_save)
+        log_file = self._log_file
+        self._log_file = None
+        self._update_max_level()
+        
+        stderr = sys.stderr
+        if stderr is not None:
+            stderr.write(f"{self._name}: couldn't write log file '{log_file}', logs are no longer saved: {error}\n")
+        
+        log_file_handle, self._log_file_handle = self._log_file_handle, None
+        if log_file_handle is not None:
+            try:
+                log_file_handle.close()
+            except OSError:
+                pass
     
-    def err(self, message: str | Any, exc_info: Exception | None = None, *, do_print: bool = True, do_save: bool = True) -> None:
+    def _write_log_lines(self, log_file: str, lines: list[str]) -> None:
+        """Writes lines to `log_file`, switching the open handle over first if needed."""
+        log_file_handle = self._log_file_handle
+        if log_file_handle is None or log_file_handle.name != log_file:
+            log_file_handle = self._open_log_file(log_file)
+        log_file_handle.write("".join(lines))
+    
+    def _open_log_file(self, log_file: str) -> TextIO:
+        """
+        Opens a log file for buffered appending and keeps it open for later records,
+        closing the previously opened one.
+        
+        Parameters:
+        - log_file (str): Path of the log file.
+        
+        Returns:
+        - TextIO: The opened log file.
         """
-        Alias for error(). Logs an error-level message with optional exception information.
+        if self._log_file_handle is not None:
+            self._log_file_handle.close()
+        
+        if self.logs_folder: os.makedirs(self.logs_folder, exist_ok=True)
+        self._log_file_handle = open(log_file, "a", encoding="utf-8", errors="backslashreplace", buffering=LOG_FILE_BUFFER_SIZE)
+        return self._log_file_handle
+    
+    def _get_log_level(self, log_type: Literal["info", "warning", "error", "critical", "debug"] | int) -> int:
+        """Helper method to map log types to log levels."""
+        return log_type if isinstance(log_type, int) else LOG_LEVELS.get(log_type, 5)
+    
+    @staticmethod
+    def _with_traceback(message: Any, exc_info: BaseException | Any) -> str:
+        """
+        Appends the formatted traceback of `exc_info` to the message.
+        
+        If `exc_info` is not an exception (e.g. `True`), the exception currently being handled is used.
+        """
+        if isinstance(exc_info, BaseException):
+            return f"{message}\n" + "".join(traceback.format_exception(exc_info))
+        return f"{message}\n{traceback.format_exc()}"
+    
+    def info(self, message: str | Any, *, do_print: bool = True, do_save: bool = True) -> None:
+        """
+        Logs an info-level message.
 
         Parameters:
         - message (Any): Message content to log.
-        - exc_info (Exception | None): Exception information to include in the log (default: None).
         - do_print (bool): Whether to print the log message to the console (default: True).
         - do_save (bool): Whether to save the log message to the log file (default: True).
         """
-        self.error(message, exc_info, do_print=do_print, do_save=do_save)
+        if 1 > self._max_level:
+            return
+        self._log_at(1, "info", message, do_print, do_save)
     
-    def error(self, message: str | Any, exc_info: Exception | None = None, *, do_print: bool = True, do_save: bool = True) -> None:
+    def warning(self, message: str | Any, *, do_print: bool = True, do_save: bool = True) -> None:
         """
-        Logs an error-level message with optional exception information.
-        
+        Logs a warning-level message.
+
         Parameters:
         - message (Any): Message content to log.
-        - exc_info (Exception | None): Exception information to include in the log (default: None).
         - do_print (bool): Whether to print the log message to the console (default: True).
         - do_save (bool): Whether to save the log message to the log file (default: True).
         """
-        if exc_info:
-            message = f"{message}\n{traceback.format_exc()}"
-        self.log("error", message, do_print=do_print, do_save=do_save)
+        if 2 > self._max_level:
+            return
+        self._log_at(2, "warning", message, do_print, do_save)
     
-    def crit(self, message: str | Any, exc_info: Exception | None = None, *, do_print: bool = True, do_save: bool = True) -> None:
+    def error(self, message: str | Any, exc_info: Exception | None = None, *, do_print: bool = True, do_save: bool = True) -> None:
         """
-        Alias for critical(). Logs a critical-level message.
+        Logs an error-level message with optional exception information.
         
         Parameters:
         - message (Any): Message content to log.
@@ -258,7 +631,11 @@ class Logger:
         - do_print (bool): Whether to print the log message to the console (default: True).
         - do_save (bool): Whether to save the log message to the log file (default: True).
         """
-        self.critical(message, exc_info, do_print=do_print, do_save=do_save)
+        if 3 > self._max_level:
+            return
+        if exc_info:
+            message = self._with_traceback(message, exc_info)
+        self._log_at(3, "error", message, do_print, do_save)
     
     def critical(self, message: str | Any, exc_info: Exception | None = None, *, do_print: bool = True, do_save: bool = True) -> None:
         """
@@ -270,9 +647,11 @@ class Logger:
         - do_print (bool): Whether to print the log message to the console (default: True).
         - do_save (bool): Whether to save the log message to the log file (default: True).
         """
+        if 4 > self._max_level:
+            return
         if exc_info:
-            message = f"{message}\n{traceback.format_exc()}"
-        self.log("critical", message, do_print=do_print, do_save=do_save)
+            message = self._with_traceback(message, exc_info)
+        self._log_at(4, "critical", message, do_print, do_save)
     
     def debug(self, message: str | Any, *, do_print: bool = True, do_save: bool = True) -> None:
         """
@@ -283,21 +662,60 @@ class Logger:
         - do_print (bool): Whether to print the log message to the console (default: True).
         - do_save (bool): Whether to save the log message to the log file (default: True).
         """
-        self.log("debug", message, do_print=do_print, do_save=do_save)
+        if 5 > self._max_level:
+            return
+        self._log_at(5, "debug", message, do_print, do_save)
     
-    def _prefix_handler(self, log_type: Literal["info", "warning", "error", "critical", "debug"], color: bool = True) -> str:
+    # aliases
+    warn = warning
+    err = error
+    crit = critical
+    
+    def _build_prefix_templates(self) -> None:
+        """
+        Precomputes the parts of the log message prefixes that do not change between calls.
+        
+        `_prefix_templates[color][level]` holds the `(head, tail)` pair that goes around the
+        timestamp (level 0 has no log type), so `_prefix_handler` only has to look up one pair
+        and concatenate. This is called again whenever an attribute used in the prefix is changed.
+        """
+        color_name = f"{reset} {self._name_color}{self._name}{reset} {self._message_color}"
+        text_name = f" {self._name} > "
+        color_texts = self._log_types_text["color"]
+        text_texts = self._log_types_text["text"]
+        color_head = reset + self._timestamp_color
+        log_types = ("", *LOG_LEVELS)
+        
+        self._prefix_templates = (
+            tuple( # color=False
+                ("", f" {text_texts.get(log_type, '')}{text_name}")
+                for log_type in log_types
+            ),
+            tuple( # color=True
+                (color_head, f"{reset} {color_texts.get(log_type, '')}{color_name}")
+                for log_type in log_types
+            )
+        )
+    
+    def _prefix_handler(self, log_type: Literal["info", "warning", "error", "critical", "debug"] | int, color: bool = True) -> str:
         """
         Generates the log message prefix including the timestamp, logger name, and log type.
         
         Parameters:
-        - log_type (str): Log type (e.g., "info", "warning", "error", "critical", "debug").
+        - log_type (str or int): Log type (e.g., "info", "warning", "error", "critical", "debug" or corresponding integer).
         - color (bool): Whether to include color formatting in the prefix (default: True).
 
         Returns:
         - str: The formatted log message prefix.
         """
-        if color:
-            return f"{reset}{self.timestamp_color}{datetime.now().strftime(self.time_format)}{reset} {self.log_types_text['color'].get(log_type, '')}{reset} {self.name_color}{self.name}{reset} {self.message_color}"
-        return f"{datetime.now().strftime(self.time_format)} {self.log_types_text['text'].get(log_type, '')} {self.name} > "
+        if self._cache_timestamp:
+            timestamp = _cached_timestamp(self._time_format)
+        else:
+            timestamp = datetime.now().strftime(self._time_format)
+        
+        level = self._get_log_level(log_type)
+        templates = self._prefix_templates[color]
+        head, tail = templates[level] if 0 <= level < len(templates) else templates[0]
+        return head + timestamp + tail
 
 logging = Logger()
\ No newline at end of file
@@ -91,21 +91,27 @@ __all__ = (
     "bg_bright_white",
 )
 
+from functools import lru_cache
+
 def ansi(code: int) -> str:
     return f"\033[{code}m"
 
+@lru_cache(maxsize=1024)
 def rgb(r: int, g: int, b: int) -> str:
     return f"\033[38;2;{r};{g};{b}m"
 
+@lru_cache(maxsize=1024)
 def hex(hex: int) -> str:
     r = hex >> 16
     g = hex >> 8 & 0xFF
     b = hex & 0xFF
     return rgb(r, g, b)
 
+@lru_cache(maxsize=1024)
 def bg_rgb(r: int, g: int, b: int) -> str:
     return f"\033[48;2;{r};{g};{b}m"
 
+@lru_cache(maxsize=1024)
 def bg_hex(hex: int) -> str:
     r = hex >> 16
     g = hex >> 8 & 0xFF
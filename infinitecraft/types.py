@@ -5,6 +5,9 @@ __all__ = (
     "Discovery"
 )
 
+# These describe JSON payloads exactly as they are decoded (plain dicts).
+# Long-lived in-memory records are slotted Element instances instead.
+
 class ResultDict(TypedDict):
     result: str
     emoji: str
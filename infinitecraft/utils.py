@@ -1,17 +1,32 @@
 import os
 import json
-import inspect
+import stat
+import mmap
+import codecs
+import shutil
+import asyncio
+import threading
 from typing import (
+    TYPE_CHECKING,
     Any, Mapping,
     Callable, Coroutine,
     TypeVar
 )
-from fastapi import FastAPI
 from . import errors
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI # imported in mock_server(), it's slow to import
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 __all__ = (
     "reify",
     "check_file",
+    "load_json",
+    "write_file_atomic",
     "dump_json",
     "maybe_coroutine",
     "mock_server"
@@ -24,6 +39,9 @@ class reify:
     A decorator that acts like a cached property. The first time the
     decorated method is called, its result is stored on the instance, and
     subsequent accesses return the cached value.
+
+    Since `reify` is a non-data descriptor, the cached value in the instance's
+    `__dict__` takes precedence over it, so `__get__` only runs on first access.
     """
 
     def __init__(self, func: Callable[[Any], _T]) -> None:
@@ -31,13 +49,13 @@ class reify:
         self.__doc__ = func.__doc__
         self.name = func.__name__
 
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        self.name = name
+
     def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
         if instance is None:
             return self
-        # Check if the cached value already exists
-        if self.name in instance.__dict__:
-            return instance.__dict__[self.name]
-        # Compute the value and cache it
+        # Compute the value and cache it; later lookups find it on the instance
         value = self.func(instance)
         instance.__dict__[self.name] = value
         return value
@@ -57,55 +75,176 @@ def check_file(path: str) -> bool:
         NotFileError: If the path exists but is not a file.
         NotDirectoryError: If the parent directory is not a directory.
     """
-    path = os.path.abspath(path)
+    # one stat tells us whether the path exists and what it is; the path is only made
+    # absolute (which costs a getcwd() for relative paths) when it is actually needed
+    try:
+        path_stat = os.stat(path)
+    except OSError: # missing, or a parent is not a directory
+        path_stat = None
+    
+    if path_stat is not None:
+        if not stat.S_ISREG(path_stat.st_mode):
+            raise errors.NotFileError(f"path '{os.path.abspath(path)}' is not a file")
+        if not os.access(path, os.W_OK):
+            raise errors.NotWritableError(f"path '{os.path.abspath(path)}' is not writable")
+        return True
     
-    if os.path.exists(path):
-        if os.path.isfile(path):
-            if not os.access(path, os.W_OK):
-                raise errors.NotWritableError(f"path '{path}' is not writable")
-            return True
-        else:
-            raise errors.NotFileError(f"path '{path}' is not a file")
+    dir = os.path.dirname(os.path.abspath(path))
+    try:
+        dir_stat = os.stat(dir)
+    except OSError:
+        return False
     
-    dir = os.path.dirname(path)
     if not os.access(dir, os.R_OK):
         return False
     
-    if os.path.isdir(dir):
-        os.makedirs(dir, exist_ok=True)
-    else:
+    if not stat.S_ISDIR(dir_stat.st_mode):
         raise errors.NotDirectoryError(f"path '{dir}' is not a directory")
     
     return False
     
+def load_json(file: str, encoding: str = "utf-8") -> Any:
+    """
+    Load JSON data from a file.
+
+    When `orjson` is installed and the encoding is UTF-8, the file is memory-mapped
+    and parsed in a single pass instead of being decoded into an intermediate string.
+
+    Args:
+        file (str): Path to the file to read JSON data from.
+        encoding (str, optional): Encoding of the file. Defaults to "utf-8".
+
+    Returns:
+        Any: The deserialized JSON data.
+    """
+    if orjson is None or codecs.lookup(encoding).name != "utf-8":
+        with open(file, encoding=encoding) as f:
+            return json.load(f)
+    
+    with open(file, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # empty files cannot be mapped
+            return orjson.loads(f.read())
+        
+        with mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+def write_file_atomic(
+    file: str,
+    payload: str | bytes,
+    encoding: str = "utf-8",
+    open_kwargs: Mapping[str, Any] | None = None
+) -> None:
+    """
+    Write a payload to a file without ever leaving it half-written.
+
+    The payload is written to a temporary file next to `file` in one write, synced to disk
+    and then moved over `file` with `os.replace()`, so a crash mid-write leaves the old file
+    intact. If `file` is a symlink, the file it points to is replaced, and the permissions of
+    an existing file are kept. The temporary file is named after the process and thread
+    writing it, so concurrent saves of the same file (e.g. from background save threads)
+    never write into each other's temporary file. If no file can be created next to `file`
+    (e.g. the directory is not writable), it is written in place.
+
+    Args:
+        file (str): Path to the file to write.
+        payload (str | bytes): Data to write. Bytes are written in binary mode.
+        encoding (str, optional): Encoding of the file for `str` payloads. Defaults to "utf-8".
+        open_kwargs (Mapping[str, Any] | None, optional): Additional keyword arguments for open() for `str` payloads. Defaults to None.
+    """
+    if isinstance(payload, bytes):
+        mode, kwargs = "wb", {}
+    elif open_kwargs:
+        mode, kwargs = "w", {"encoding": encoding, **open_kwargs}
+    else:
+        mode, kwargs = "w", {"encoding": encoding}
+    
+    file = os.path.realpath(file) # replace the file a symlink points to, not the symlink
+    tmp = f"{file}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        f = open(tmp, mode, **kwargs)
+    except PermissionError:
+        with open(file, mode, **kwargs) as f:
+            f.write(payload)
+        return
+    
+    try:
+        with f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno()) # on disk before it replaces the old file, or a crash could leave it empty
+        try:
+            shutil.copymode(file, tmp)
+        except FileNotFoundError: # a new file
+            pass
+        os.replace(tmp, file)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
 def dump_json(
     file: str,
     data: Any,
     encoding: str = "utf-8",
-    indent: int = 2,
-    open_kwargs: Mapping[str, Any] = {},
-    dump_kwargs: Mapping[str, Any] = {}
+    indent: int | None = None,
+    open_kwargs: Mapping[str, Any] | None = None,
+    dump_kwargs: Mapping[str, Any] | None = None
 ) -> None:
     """
     Dump JSON data into a file.
 
+    When `orjson` is installed, the encoding is UTF-8 and the requested formatting is
+    something `orjson` can produce (no indentation or an indent of 2, optionally with
+    `sort_keys`), the data is serialized to bytes in one call and written in binary mode.
+    Anything else is encoded with `json.dumps` (so `dump_kwargs` such as `default=` or
+    `cls=` keep working). Either way the file is replaced atomically, see `write_file_atomic`.
+
     Args:
         file (str): Path to the file where JSON data will be written.
         data (Any): JSON-serializable data to be dumped.
         encoding (str, optional): Encoding of the file. Defaults to "utf-8".
-        indent (int, optional): Number of spaces to use as indentation. Defaults to 2.
-        open_kwargs (Mapping[str, Any], optional): Additional keyword arguments for open(). Defaults to {}.
-        dump_kwargs (Mapping[str, Any], optional): Additional keyword arguments for json.dump(). Defaults to {}.
+        indent (int | None, optional): Number of spaces to use as indentation, or None for compact output. Defaults to None.
+        open_kwargs (Mapping[str, Any] | None, optional): Additional keyword arguments for open(). Defaults to None.
+        dump_kwargs (Mapping[str, Any] | None, optional): Additional keyword arguments for json.dumps(). Defaults to None.
     """
-    with open(file, "w", encoding=encoding, **open_kwargs) as f:
-        json.dump(data, f, indent=indent, **dump_kwargs)
+    if (
+        orjson is not None
+        and indent in (None, 2)
+        and not open_kwargs
+        and (not dump_kwargs or dump_kwargs.keys() <= {"sort_keys"})
+        and codecs.lookup(encoding).name == "utf-8"
+    ):
+        option = orjson.OPT_NON_STR_KEYS # json.dump converts non-str keys too
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if dump_kwargs and dump_kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        
+        write_file_atomic(file, orjson.dumps(data, option=option))
+        return
+    
+    # encode up front and write once; json.dump() would issue a write per token
+    if dump_kwargs:
+        if indent is None and "separators" not in dump_kwargs:
+            dump_kwargs = {"separators": (",", ":"), **dump_kwargs} # no spaces in compact output
+        payload = json.dumps(data, indent=indent, **dump_kwargs)
+    elif indent is None:
+        payload = json.dumps(data, separators=(",", ":"))
+    else:
+        payload = json.dumps(data, indent=indent)
+    write_file_atomic(file, payload, encoding=encoding, open_kwargs=open_kwargs)
 
 async def maybe_coroutine(__func: Callable[..., Coroutine[Any, Any, Any]], *args: Any, **kwargs: Any) -> Any | None:
     """
     Execute a callable or coroutine with given arguments.
 
     This function can handle both regular functions and coroutines. It will await
-    coroutines and directly call regular functions.
+    coroutines and directly call regular functions. The callable is called first and
+    its result awaited if it is a coroutine, so no per-call inspection of the callable is done.
 
     Args:
         __func (Callable[..., Coroutine[Any, Any, Any]]): The callable or coroutine to execute.
@@ -115,20 +254,26 @@ async def maybe_coroutine(__func: Callable[..., Coroutine[Any, Any, Any]], *args
     Returns:
         Any | None: The return value of the executed function or coroutine.
     """
-    if inspect.iscoroutine(__func):
+    if asyncio.iscoroutine(__func):
         return await __func
-    elif inspect.iscoroutinefunction(__func):
-        return await __func(*args, **kwargs)
-    else:
-        return __func(*args, **kwargs)
+    
+    # call first and look at what came back, instead of inspecting the callable
+    result = __func(*args, **kwargs)
+    if asyncio.iscoroutine(result):
+        return await result
+    return result
 
-def mock_server() -> FastAPI:
+def mock_server(*, log_requests: bool = True) -> "FastAPI":
     """
     Create and configure a mock FastAPI server for testing purposes.
 
     This function sets up a FastAPI application with a single endpoint that simulates
     the behavior of an infinite craft pairing API.
 
+    Args:
+        log_requests (bool, optional): Whether to print each request and its mock result
+                                       to the console. Defaults to True.
+
     Returns:
         FastAPI: A configured FastAPI application instance with the following endpoint:
             - GET /api/infinite-craft/pair: Simulates pairing two items.
@@ -140,25 +285,36 @@ def mock_server() -> FastAPI:
                 - second (str): The name of the second item to pair.
             - Returns:
                 A dictionary with the following keys:
-                - result (str): Always returns "???" to simulate an unknown result.
+                - result (str): The two names joined by " + ", in sorted order so the result
+                                doesn't depend on the order of the items, like in the game.
                 - emoji (str): Always returns "🌌" as the result emoji.
                 - isNew (bool): Always returns False, indicating the result is not new.
 
     Note:
-        This mock server prints debugging information to the console for each request,
-        including the paired items and the mock result.
+        Unless `log_requests` is False, this mock server prints debugging information to
+        the console for each request, including the paired items and the mock result.
     """
+    from fastapi import FastAPI, Response
+    
     app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    
+    # only the result name changes between requests, so the rest of the body is serialized once
+    body_start = b'{"result":'
+    body_end = b',"emoji":' + dumps("🌌") + b',"isNew":false}'
 
-    @app.get("/api/infinite-craft/pair")
-    async def pair(first: str, second: str) -> dict[str, str | bool]: # pyright: ignore[reportUnusedFunction]
-        print(f"[MOCK API] PAIR: {first} + {second}")
-        print(f"[MOCK API] RESULT: 🌌 ???")
+    @app.get("/api/infinite-craft/pair", response_class=Response)
+    async def pair(first: str, second: str) -> Response: # pyright: ignore[reportUnusedFunction]
+        result = " + ".join(sorted((first, second)))
+        if log_requests:
+            print(f"[MOCK API] PAIR: {first} + {second}\n"
+                  f"[MOCK API] RESULT: 🌌 {result}")
         
-        return {
-            "result": "???",
-            "emoji": "🌌",
-            "isNew": False
-        }
+        return Response(body_start + dumps(result) + body_end, media_type="application/json")
     
     return app
\ No newline at end of file
@@ -0,0 +1,62 @@
+import os
+import pytest
+import uvicorn
+from typing import Any
+from uvicorn import Config
+from threading import Thread, Event
+
+from infinitecraft.utils import mock_server
+
+HOST = "127.0.0.1"
+# every pytest-xdist worker ("gw0", "gw1", ...) runs its own mock server, on its own port
+PORT = int(os.environ.get("MOCK_PORT", 15575)) + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+MOCK_API_URL = f"http://{HOST}:{PORT}"
+
+class NotifyingServer(uvicorn.Server):
+    """A uvicorn server that sets an event once it has started serving."""
+    def __init__(self, config: Config, started: Event):
+        super().__init__(config)
+        self.started_event = started
+
+    async def startup(self, sockets: Any = None):
+        await super().startup(sockets=sockets)
+        self.started_event.set()
+
+class ThreadedUvicorn:
+    def __init__(self, *args: Any, config: Config | None = None, **kwargs: Any):
+        self.started = Event()
+        if config is None:
+            config = Config(*args, **kwargs)
+        self.server = NotifyingServer(config, self.started)
+        self.thread = Thread(daemon=True, target=self.server.run)
+
+    def start(self, timeout: float = 10):
+        self.thread.start()
+        if not self.started.wait(timeout): # e.g. the port is already in use
+            self.stop()
+            raise RuntimeError(f"MOCK API server did not start within {timeout} seconds")
+
+    def stop(self, timeout: float = 5):
+        if self.thread.is_alive():
+            self.server.should_exit = True
+            self.thread.join(timeout)
+            
+            if self.thread.is_alive(): # stuck shutting down, e.g. waiting on open connections
+                self.server.force_exit = True
+                self.thread.join(timeout)
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_api():
+    # uvicorn's default "auto" loop and http settings use uvloop and httptools when they are
+    # installed (dev extra), and fall back to asyncio and h11 when they aren't
+    server = ThreadedUvicorn(mock_server(log_requests=False), host=HOST, port=PORT)
+    
+    print("Starting MOCK API server")
+    server.start()
+    print("MOCK API server started")
+    
+    yield MOCK_API_URL
+    
+    print("Stopping MOCK API server")
+    server.stop()
+    print("MOCK API server stopped")
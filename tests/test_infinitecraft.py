@@ -1,85 +1,50 @@
 import os
+import json
 import time
 import pytest
 import asyncio
-import uvicorn
+import threading
+import contextlib
+import pytest_asyncio
 from typing import Any
-from uvicorn import Config
-from threading import Thread
+from pathlib import Path
 
-from infinitecraft       import (
+import infinitecraft.infinitecraft as infinitecraft_module
+from infinitecraft import (
     InfiniteCraft,
     Element
 )
-from infinitecraft.utils import mock_server
 
-HOST = "127.0.0.1"
-PORT = 15575
-
-kwargs: Any = dict(
-    api_url = f"http://{HOST}:{PORT}",
-    discoveries_storage = "tests/discoveries.json",
+base_kwargs: Any = dict(
     debug = True
 )
+real_sleep = asyncio.sleep
 
-def remove():
-    file = kwargs.get("discoveries_storage")
-    if os.path.exists(file):
-        os.remove(file)
-
-class ThreadedUvicorn:
-    def __init__(self, *args: Any, config: Config | None = None, **kwargs: Any):
-        if config is None:
-            self.server = uvicorn.Server(Config(*args, **kwargs))
-        else:
-            self.server = uvicorn.Server(config)
-        self.thread = Thread(daemon=True, target=self.server.run)
-
-    def start(self):
-        self.thread.start()
-        asyncio.run(self.wait_for_started())
-
-    async def wait_for_started(self):
-        while not self.server.started:
-            await asyncio.sleep(0.1)
-
-    def stop(self):
-        if self.thread.is_alive():
-            self.server.should_exit = True
-            while self.thread.is_alive():
-                continue
-
-# mock server
-app = mock_server()
-server = ThreadedUvicorn(app, host=HOST, port=PORT)
-
-print("Starting MOCK API server")
-server.start()
-print("MOCK API server started")
+@pytest.fixture
+def kwargs(mock_api: str, tmp_path: Path) -> dict[str, Any]:
+    # every test gets a discoveries file in its own temporary folder, so tests can't see each other's files
+    return {**base_kwargs, "api_url": mock_api, "discoveries_storage": str(tmp_path / "discoveries.json")}
 
-remove()
+@pytest_asyncio.fixture(scope="session")
+async def game(mock_api: str, tmp_path_factory: pytest.TempPathFactory):
+    # one started instance, for tests that don't depend on a fresh discoveries file or session
+    discoveries_storage = str(tmp_path_factory.mktemp("shared") / "discoveries.json")
+    async with InfiniteCraft(**base_kwargs, api_url=mock_api, discoveries_storage=discoveries_storage) as game: # type: ignore
+        yield game
 
 class TestInfiniteCraftFiles:
-    @pytest.mark.asyncio
-    async def test_make_file_False(self):
-        remove()
+    def test_make_file_False(self, kwargs: dict[str, Any]):
         with pytest.raises(FileNotFoundError):
             InfiniteCraft(**kwargs, make_file=False)
     
-    @pytest.mark.asyncio
-    async def test_make_file_True(self):
-        remove()
+    def test_make_file_True(self, kwargs: dict[str, Any]):
         InfiniteCraft(**kwargs, make_file=True)
         assert os.path.exists(kwargs.get("discoveries_storage"))
     
-    @pytest.mark.asyncio
-    async def test_make_file_and_do_reset_True(self):
-        remove()
+    def test_make_file_and_do_reset_True(self, kwargs: dict[str, Any]):
         InfiniteCraft(**kwargs, do_reset=True, make_file=True)
     
-    @pytest.mark.asyncio
-    async def test_make_file_and_do_reset_False(self):
-        remove()
+    def test_make_file_and_do_reset_False(self, kwargs: dict[str, Any]):
         with pytest.raises(FileNotFoundError):
             InfiniteCraft(**kwargs, do_reset=False, make_file=False)
         
@@ -88,9 +53,80 @@ class TestInfiniteCraftFiles:
         InfiniteCraft(**kwargs, do_reset=False, make_file=False)
         assert os.path.exists(kwargs.get("discoveries_storage"))
 
-@pytest.mark.asyncio
-async def test_InfiniteCraft():
-    remove()
+class FakeClock:
+    """
+    Stands in for `time.monotonic` and `asyncio.sleep` while rate limiting is checked,
+    so waits are recorded and skipped instead of slept through.
+    
+    `asyncio.sleep` is patched for the whole process, so sleeps from other threads (like the
+    mock API server's) are passed on to the real one instead of being recorded.
+    """
+    def __init__(self):
+        self.now = time.monotonic()
+        self.sleeps: list[float] = []
+        self.thread = threading.get_ident()
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    async def sleep(self, delay: float, *args: Any, **kwargs: Any):
+        if threading.get_ident() != self.thread:
+            return await real_sleep(delay, *args, **kwargs)
+        if delay > 0:
+            self.sleeps.append(delay)
+            self.now += delay
+        await real_sleep(0)
+
+async def check_requests(game: InfiniteCraft, monkeypatch: pytest.MonkeyPatch):
+    """Checks pairing, rate limiting and the pair cache on a started instance."""
+    # --- test_check_requests ---
+    clock = FakeClock()
+    with monkeypatch.context() as patch:
+        patch.setattr(infinitecraft_module, "time", clock)
+        patch.setattr(asyncio, "sleep", clock.sleep)
+        patch.setattr(game, "_api_rate_limit_window", 6) # a shorter window takes the same code path
+        
+        # --- test_check_pairing ---
+        first = Element("Fire")
+        second = Element("Water")
+        third = Element("Earth")
+        
+        # --- test_check_store_False ---
+        result = await game.pair(first, second, store=False)
+        assert result not in game.discoveries
+        # ------------------------------
+        
+        current = clock.monotonic() - 5
+        game._requests = [current] * (game._api_rate_limit - 1) # adding 1 less than ratelimit amount of dummy requests # type: ignore
+        
+        result = await game.pair(first, third) # not paired before, so this has to make a request
+        assert result is not None
+        assert result in game.discoveries
+        # --------------------------
+        
+        assert not clock.sleeps # not ratelimited
+        
+        current = clock.monotonic() - 5
+        game._requests = [current] * game._api_rate_limit # adding ratelimit amount of dummy requests # type: ignore
+        
+        result = await game.pair(second, third)
+        
+        assert sum(clock.sleeps) == pytest.approx(1) # waited 1 second for the oldest request to leave the 6 second window
+        
+        # --- test_check_pair_cache ---
+        current = clock.monotonic() - 5
+        game._requests = [current] * game._api_rate_limit # adding ratelimit amount of dummy requests # type: ignore
+        clock.sleeps.clear()
+        
+        result = await game.pair(second, first) # paired before (in the other order), so no request is made
+        
+        assert not clock.sleeps # not ratelimited
+        assert result in game.discoveries # stored now, even though it was first paired with store=False
+        # -----------------------------
+    
+    # ---------------------------
+
+async def test_InfiniteCraft(monkeypatch: pytest.MonkeyPatch, kwargs: dict[str, Any]):
     game = InfiniteCraft(**kwargs)
     
     # --- test_check_session_before ---
@@ -104,47 +140,7 @@ async def test_InfiniteCraft():
     
     assert game.closed == False # test_session_started
     
-    # --- test_check_ping ---
-    ping = await game.ping()
-    print(ping, "seconds")
-    assert ping >= 0
-    # -----------------------
-    
-    # --- test_check_requests ---
-    
-    start = time.monotonic()
-    
-    # --- test_check_pairing ---
-    first = Element("Fire")
-    second = Element("Water")
-    
-    # --- test_check_store_False ---
-    result = await game.pair(first, second, store=False)
-    assert result not in game.discoveries
-    # ------------------------------
-    
-    current = time.monotonic() - 50
-    game._requests = [current for i in range(game._api_rate_limit - 1)] # adding 1 less than ratelimit amount of dummy requests # type: ignore
-    
-    result = await game.pair(first, second)
-    assert result is not None
-    assert result in game.discoveries
-    # --------------------------
-    
-    time_taken = round(time.monotonic() - start)
-    
-    assert time_taken < 2 # 2 seconds for good measure
-    
-    current = time.monotonic() - 50
-    game._requests = [current for i in range(game._api_rate_limit)] # adding ratelimit amount of dummy requests # type: ignore
-    
-    start = time.monotonic()
-    result = await game.pair(first, second)
-    time_taken = round(time.monotonic() - start)
-    
-    assert time_taken >= 10 and time_taken < 12 # 10 seconds for "rate limit" and +2 seconds for good measure
-    
-    # ---------------------------
+    await check_requests(game, monkeypatch)
     
     await game.close() # test_end_session
     
@@ -153,11 +149,12 @@ async def test_InfiniteCraft():
     
     with pytest.raises(RuntimeError):
         await game.start()
+    
+    with pytest.raises(RuntimeError):
+        await game.pair(Element("Fire"), Element("Water"))
     # --------------------------------
 
-@pytest.mark.asyncio
-async def test_InfiniteCraft_async_with():
-    remove()
+async def test_InfiniteCraft_async_with(kwargs: dict[str, Any]):
     game = InfiniteCraft(**kwargs)
     
     # --- test_check_session_before ---
@@ -180,61 +177,162 @@ async def test_InfiniteCraft_async_with():
         await game.start()
     # --------------------------------
 
-@pytest.mark.asyncio
-async def test_InfiniteCraft_async_with2():
-    remove()
+async def test_InfiniteCraft_async_with2(monkeypatch: pytest.MonkeyPatch, kwargs: dict[str, Any]):
     
     # --- test_session ---
     async with InfiniteCraft(**kwargs) as game: # test_start_session  # type: ignore
         game: InfiniteCraft
 
-        # --- test_check_ping ---
-        ping = await game.ping()
-        print(ping, "seconds")
-        assert ping >= 0
-        # -----------------------
-        
         assert game.closed == False # test_session_started
         
-        # --- test_check_requests ---
-        
-        start = time.monotonic()
-        
-        # --- test_check_pairing ---
-        first = Element("Fire")
-        second = Element("Water")
-        
-        # --- test_check_store_False ---
-        result = await game.pair(first, second, store=False)
-        assert result not in game.discoveries
-        # ------------------------------
-        
-        current = time.monotonic() - 50
-        game._requests = [current for i in range(game._api_rate_limit - 1)] # adding 1 less than ratelimit amount of dummy requests # type: ignore
-        
-        result = await game.pair(first, second)
-        assert result is not None
-        # --------------------------
+        await check_requests(game, monkeypatch)
+    # --------------------------
+
+async def test_InfiniteCraft_pair_many(kwargs: dict[str, Any]):
+
+    async with InfiniteCraft(**kwargs) as game: # type: ignore
+        game: InfiniteCraft
+
+        with pytest.raises(ValueError):
+            await game.pair_many([], concurrency=0)
+
+        pairs = [
+            (Element("Fire"), Element("Water")),
+            (Element("Earth"), Element("Wind")),
+            (Element("Fire"), Element("Earth"))
+        ]
+
+        results = await game.pair_many(pairs, concurrency=2)
+        assert len(results) == len(pairs)
+
+        for (first, second), result in zip(pairs, results):
+            assert result.name == " + ".join(sorted((first.name, second.name))) # the mock API names results after the pair
+            assert result in game.discoveries
+    
+    # --- test_discoveries_saved_on_close ---
+    with open(kwargs.get("discoveries_storage"), encoding="utf-8") as f:
+        saved = [discovery["name"] for discovery in json.load(f)]
+    
+    for result in results:
+        assert result.name in saved
+        assert game.get_discovery(result.name, from_file=True) == result
+    # ---------------------------------------
+
+async def test_InfiniteCraft_reload_unsaved(kwargs: dict[str, Any]):
+    async with InfiniteCraft(**kwargs) as game: # type: ignore
+        game: InfiniteCraft
         
-        time_taken = round(time.monotonic() - start)
+        # fewer pairs than are saved in one batch, so none of these are in the file yet
+        results = [await game.pair(Element("Fire"), Element(name)) for name in ("Water", "Earth", "Wind")]
         
-        assert time_taken < 2 # 2 seconds for good measure
+        for result in results:
+            assert game.get_discovery(result.name, from_file=True) == result
         
-        current = time.monotonic() - 50
-        game._requests = [current for i in range(game._api_rate_limit)] # adding ratelimit amount of dummy requests # type: ignore
+        game.get_discoveries(set_value=True)
+        for result in results:
+            assert result in game.discoveries # kept, not replaced by the file's contents
+    
+    with open(kwargs.get("discoveries_storage"), encoding="utf-8") as f:
+        saved = [discovery["name"] for discovery in json.load(f)]
+    
+    for result in results:
+        assert result.name in saved # and still saved on close
+
+async def test_InfiniteCraft_pair_many_failure(game: InfiniteCraft, monkeypatch: pytest.MonkeyPatch):
+    calls: list[tuple[Element, Element]] = []
+    
+    async def pair(first: Element, second: Element, *, store: bool = True) -> Element:
+        calls.append((first, second))
+        if len(calls) == 1:
+            raise ValueError("pair failed")
+        await real_sleep(0)
+        return Element("???")
+    
+    monkeypatch.setattr(game, "pair", pair)
+    pairs = [(Element("Fire"), Element("Water"))] * 20
+    
+    with pytest.raises(ValueError):
+        await game.pair_many(pairs, concurrency=2)
+    
+    await real_sleep(0.01)
+    assert len(calls) < len(pairs) # the other worker was cancelled instead of pairing the rest
+
+async def test_InfiniteCraft_failed_save(monkeypatch: pytest.MonkeyPatch, kwargs: dict[str, Any]):
+    def dump_json(*args: Any, **kwargs: Any):
+        raise OSError("disk full")
+    
+    game = InfiniteCraft(**kwargs)
+    await game.start()
+    result = await game.pair(Element("Fire"), Element("Water"))
+    
+    with monkeypatch.context() as patch:
+        patch.setattr(infinitecraft_module.utils, "dump_json", dump_json)
         
-        start = time.monotonic()
-        result = await game.pair(first, second)
-        time_taken = round(time.monotonic() - start)
+        with pytest.raises(OSError):
+            await game.close()
+    
+    assert game.closed == True # closed even though saving failed
+    
+    game.flush() # still unsaved, so saving is retried
+    assert game.get_discovery(result.name, from_file=True) == result
+
+async def test_InfiniteCraft_ping(game: InfiniteCraft):
+    ping = await game.ping()
+    print(ping, "seconds")
+    assert ping >= 0
+
+async def test_InfiniteCraft_pair_stream(game: InfiniteCraft):
+    with pytest.raises(ValueError):
+        async for _ in game.pair_stream([], concurrency=0):
+            pass
+
+    pairs = [
+        (Element("Fire"), Element("Water")),
+        (Element("Earth"), Element("Wind")),
+        (Element("Fire"), Element("Earth"))
+    ]
+
+    async def candidates():
+        for elements in pairs:
+            yield elements
+
+    streamed = [elements async for elements, result in game.pair_stream(candidates(), concurrency=2)]
+    assert sorted(streamed, key=pairs.index) == pairs
+
+    async for (first, second), result in game.pair_stream(pairs, concurrency=2):
+        assert (first, second) in pairs
+        assert result.name == " + ".join(sorted((first.name, second.name))) # yielded with its own pair
+        assert result in game.discoveries
+    
+    # --- test_early_exit ---
+    calls: list[tuple[Element, Element]] = []
+    
+    async def pair(first: Element, second: Element, *, store: bool = True) -> Element:
+        calls.append((first, second))
+        await real_sleep(0)
+        return Element("???")
+    
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(game, "pair", pair)
         
-        assert time_taken >= 10 and time_taken < 12 # 10 seconds for "rate limit" and +2 seconds for good measure
+        async with contextlib.aclosing(game.pair_stream(pairs * 10, concurrency=2)) as stream:
+            async for _ in stream:
+                break
         
-        # ---------------------------
-    # --------------------------
+        await real_sleep(0.01)
+        assert len(calls) < len(pairs) * 10 # the workers were cancelled when the stream was closed
+    # -----------------------
+    
+    # --- test_flush ---
+    game.flush()
+    with open(game.discoveries_location, encoding="utf-8") as f:
+        saved = [discovery["name"] for discovery in json.load(f)]
+    
+    for discovery in game.discoveries:
+        assert discovery.name in saved
+    # ------------------
 
-@pytest.mark.asyncio
-async def test_InfiniteCraft_manual_control():
-    remove()
+async def test_InfiniteCraft_manual_control(kwargs: dict[str, Any]):
     game = InfiniteCraft(**kwargs, manual_control=True)
     
     await game.start() # test_start_session
@@ -249,11 +347,3 @@ async def test_InfiniteCraft_manual_control():
     with pytest.raises(RuntimeError):
         await game.start()
     # --------------------------------
-
-def pytest_sessionfinish(session: Any, exitstatus: Any):
-    print("Clean files")
-    remove()
-    print("Stopping MOCK API server")
-    server.stop()
-    print("MOCK API server stopped")
-    print("Test finished")
\ No newline at end of file